@@ -1,31 +1,81 @@
+import importlib as _importlib
 from .core.keyboard import type, key, clear, ime_on, ime_off, confirm_input
 from .core.mouse import move_mouse, hover
-from .capture.screenshot import screenshot
-from .capture.ocr import ocr, initialize_ocr, is_ocr_initialized
-from .vision.template import get_img_center_coords, get_text_center_coords, wait_for_screen_change
+from .capture.screenshot import screenshot, CaptureSession, get_capture_session, close_capture_session
+from .capture.ocr_result import OCRResult
+from .capture.stream import FrameStream, start_frame_stream, stop_frame_stream, get_frame_stream
+from .capture.ocr import ocr, ocr_batch, ocr_tiles, get_ocr_tile_cache, enable_ocr_cache, disable_ocr_cache, ocr_cache_stats, OCRProfile, register_ocr_profile, get_ocr_profile, set_ocr_profile, initialize_ocr, warm_up_ocr, is_ocr_initialized, use_ocr_server
+from .vision.template import get_img_center_coords, get_text_center_coords, wait_for_text, wait_for_screen_change, set_pyramid_search, find_any, find_all_templates, find_all
 from .vision import initialize_visual, is_visual_initialized
+from .vision.registry import Template, TemplateRegistry, get_template_registry, load_template
 from .actions.click import click, dbclick, rightclick
 from .actions.wait_presence import wait_presence
 from .actions.scroll import scroll_up, scroll_down
-from .actions.goto import goto
-from .core.browser import init_driver, get_driver, close_driver, close_all_drivers, read, select_by_value, wait_element_hidden, get_elements
 from .utils import clipboard, clipboard_copy
 
 __all__ = [
     "type", "key", "clear", "ime_on", "ime_off", "confirm_input",
     "move_mouse", "hover",
     "init_driver", "get_driver", "close_driver", "close_all_drivers", "read", "select_by_value", "wait_element_hidden", "get_elements",
+    "set_wait_engine", "set_thread_driver",
+    "DriverProfile", "register_driver_profile", "get_load_timings", "reset_load_timings", "get_snapshot_stats",
+    "get_element_cache", "set_element_cache", "invalidate_elements", "DriverPool", "get_driver_pool", "close_driver_pool",
+    "Session", "JobResult", "run_jobs", "iter_table_rows", "write_rows_csv", "write_rows_jsonl",
     "goto",
-    "screenshot", "ocr",
-    "wait_for_screen_change",
-    "initialize_ocr", "is_ocr_initialized",
+    "screenshot", "ocr", "OCRResult", "ocr_batch", "ocr_tiles", "get_ocr_tile_cache",
+    "enable_ocr_cache", "disable_ocr_cache", "ocr_cache_stats",
+    "OCRProfile", "register_ocr_profile", "get_ocr_profile", "set_ocr_profile",
+    "CaptureSession", "get_capture_session", "close_capture_session",
+    "FrameStream", "start_frame_stream", "stop_frame_stream", "get_frame_stream",
+    "wait_for_text", "wait_for_screen_change", "set_pyramid_search",
+    "initialize_ocr", "warm_up_ocr", "is_ocr_initialized", "use_ocr_server",
     "initialize_visual", "is_visual_initialized",
-    "get_img_center_coords", "get_text_center_coords",
+    "get_img_center_coords", "get_text_center_coords", "find_any", "find_all_templates", "find_all",
+    "Template", "TemplateRegistry", "get_template_registry", "load_template",
     "click", "dbclick", "rightclick",
     "scroll_up", "scroll_down",
     "clipboard", "clipboard_copy",
     "wait_presence",
 ]
 
-# Initialize OCR by default for backward compatibility
-initialize_ocr()
\ No newline at end of file
+# Selenium-backed helpers are imported on first use, so `import PyAutomate`
+# doesn't load selenium. OCR (easyocr/torch) is loaded by the first ocr() call
+# or by warm_up_ocr().
+_LAZY_ATTRS = {
+    "init_driver": ".core.browser",
+    "get_driver": ".core.browser",
+    "close_driver": ".core.browser",
+    "close_all_drivers": ".core.browser",
+    "read": ".core.browser",
+    "select_by_value": ".core.browser",
+    "wait_element_hidden": ".core.browser",
+    "get_elements": ".core.browser",
+    "set_wait_engine": ".core.browser",
+    "set_thread_driver": ".core.browser",
+    "DriverProfile": ".core.browser",
+    "register_driver_profile": ".core.browser",
+    "get_load_timings": ".core.browser",
+    "reset_load_timings": ".core.browser",
+    "get_snapshot_stats": ".core.browser",
+    "get_element_cache": ".core.browser",
+    "set_element_cache": ".core.browser",
+    "invalidate_elements": ".core.browser",
+    "DriverPool": ".core.driver_pool",
+    "get_driver_pool": ".core.driver_pool",
+    "close_driver_pool": ".core.driver_pool",
+    "Session": ".core.session",
+    "JobResult": ".core.session",
+    "run_jobs": ".core.session",
+    "iter_table_rows": ".core.table_stream",
+    "write_rows_csv": ".core.table_stream",
+    "write_rows_jsonl": ".core.table_stream",
+    "goto": ".actions.goto",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,20 +1,18 @@
 from ..vision.template import get_img_center_coords, get_text_center_coords
 from ..core.mouse import mouse, hover
-from selenium.webdriver.common.action_chains import ActionChains
 from pynput.mouse import Button
 import time
-from ..core.browser import get_driver, wait_for_element
 
 def click(target, x_offset=0, y_offset=0, timeout=10, driver=None, selector_type=None ):
     if target is not None:
         if selector_type is not None:
+            from ..core.browser import get_driver, with_element
             if driver is None:
                 driver = get_driver()
             if driver is None:
                 raise ValueError("Driver is not initialized")
-            element = wait_for_element(driver, "interactable", selector_type, target, timeout)
+            element, _ = with_element(driver, selector_type, target, lambda el: el.click(), timeout)
             if element:
-                element.click()
                 return True
             else:
                 print(f"No clickable element found for: {target}")
@@ -43,14 +41,18 @@ def click(target, x_offset=0, y_offset=0, timeout=10, driver=None, selector_type
 
 def dbclick(target, x_offset=0, y_offset=0, timeout=10, driver=None, selector_type=None, element=None ):
     if selector_type is not None:
+        from selenium.webdriver.common.action_chains import ActionChains
+        from ..core.browser import get_driver, with_element
         if driver is None:
             driver = get_driver()
         if driver is None:
             raise ValueError("Driver is not initialized")
-        if element is None:
-            element = wait_for_element(driver, "interactable", selector_type, target, timeout)
+        double_click = lambda el: ActionChains(driver).double_click(el).perform()
+        if element is not None:
+            double_click(element)
+            return True
+        element, _ = with_element(driver, selector_type, target, double_click, timeout)
         if element:
-            ActionChains(driver).double_click(element).perform()
             return True
         else:
             print(f"No double-clickable element found for: {target}")
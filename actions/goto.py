@@ -1,4 +1,5 @@
-from ..core.browser import init_driver, get_driver
+import time
+from ..core.browser import init_driver, get_driver, record_load_time, invalidate_elements, _note_origin
 
 def goto(url, driver=None):
     try:
@@ -8,8 +9,12 @@ def goto(url, driver=None):
             else:
                 driver = get_driver()
         
+        invalidate_elements(driver)
+        _note_origin(driver, url)
+        start = time.perf_counter()
         driver.get(url)
+        record_load_time(driver, time.perf_counter() - start)
         return driver
     except Exception as e:
         print(f"Error opening URL: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -1,11 +1,10 @@
-import cv2
-from ..capture.screenshot import screenshot
 from ..vision.template import get_img_center_coords, _debug_print
 from .. import is_visual_initialized
-from ..core.browser import get_driver, get_selector_type, wait_for_element
+from ..vision.registry import load_template
 
 def wait_presence(target, selector_type=None, driver=None, timeout=None, screen_img=None):
     if selector_type is not None or driver is not None:
+        from ..core.browser import get_driver, wait_for_element
         if selector_type is None:
             return False
         if driver is None:
@@ -19,17 +18,12 @@ def wait_presence(target, selector_type=None, driver=None, timeout=None, screen_
             
         img_path = target.lstrip('/')
         _debug_print(f"Looking for image {img_path}")
-        img = cv2.imread(img_path, cv2.IMREAD_UNCHANGED)
-        if img is None:
+        template = load_template(img_path)
+        if template is None:
             print("Failed to load image")
             return False
-        bgr   = img[...,:3]
-        alpha = img[..., 3]
-        _, mask = cv2.threshold(alpha, 1, 255, cv2.THRESH_BINARY)
         
-        if screen_img is None:
-            screen_img, _ = screenshot()
-        coords = get_img_center_coords(bgr, mask, screen_img, 0, 0, timeout)
+        coords = get_img_center_coords(template, template.mask, screen_img, 0, 0, timeout)
         if coords:
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Benchmark: `import PyAutomate` wall time and heavy modules loaded at import.
+
+Run from the directory that contains the PyAutomate package:
+
+    python -m PyAutomate.benchmarks.import_time
+"""
+import os
+import subprocess
+import sys
+
+# Import must stay under this budget (seconds) and must not load these modules
+IMPORT_BUDGET = 1.5
+LAZY_MODULES = ('torch', 'easyocr', 'selenium')
+RUNS = 3
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import {PACKAGE}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]
+print(elapsed, ','.join(loaded))
+"""
+
+def measure():
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=os.path.dirname(PACKAGE_DIR),
+                         capture_output=True, text=True, check=True).stdout.split()
+    elapsed = float(out[0])
+    loaded = out[1].split(',') if len(out) > 1 else []
+    return elapsed, loaded
+
+def main():
+    results = [measure() for _ in range(RUNS)]
+    best = min(elapsed for elapsed, _ in results)
+    loaded = sorted({m for _, mods in results for m in mods})
+    print(f"import {PACKAGE}: best of {RUNS} = {best * 1000:.0f} ms (budget {IMPORT_BUDGET * 1000:.0f} ms)")
+    print(f"heavy modules loaded at import: {', '.join(loaded) if loaded else 'none'}")
+    ok = best <= IMPORT_BUDGET and not loaded
+    print("OK" if ok else "OVER BUDGET")
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
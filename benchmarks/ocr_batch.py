@@ -0,0 +1,68 @@
+"""
+Benchmark: ocr_batch() against a sequential ocr() loop over the same fields.
+
+Also times EasyOCR's own Reader.recognize() on the same boxes, which skips detection
+too but reads the boxes one by one on the CPU, to separate the gain of skipping
+detection from the gain of batching.
+
+Run from the directory that contains the PyAutomate package:
+
+    python -m PyAutomate.benchmarks.ocr_batch
+"""
+import time
+import cv2
+import numpy as np
+from ..capture.ocr import ocr, ocr_batch, initialize_ocr, get_ocr_profile, _get_reader
+
+FIELDS = 30
+
+def synthetic_form(fields=FIELDS):
+    """A 1920x1080 form with `fields` labelled values and their boxes."""
+    img = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    regions, values = [], []
+    for i in range(fields):
+        col, row = divmod(i, 15)
+        x, y = 100 + col * 900, 60 + row * 65
+        value = f"{1000 + i * 37} USD"
+        cv2.putText(img, f"Field {i + 1}:", (x, y + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2, cv2.LINE_AA)
+        cv2.putText(img, value, (x + 250, y + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2, cv2.LINE_AA)
+        regions.append((x + 240, y, x + 480, y + 45))
+        values.append(value)
+    return img, regions, values
+
+def main():
+    initialize_ocr()
+    img, regions, values = synthetic_form()
+
+    start = time.perf_counter()
+    sequential = [ocr(img[y1:y2, x1:x2]) for x1, y1, x2, y2 in regions]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = ocr_batch(regions, img)
+    batched_time = time.perf_counter() - start
+
+    reader = _get_reader(get_ocr_profile())
+    horizontal_list = [[x1, x2, y1, y2] for x1, y1, x2, y2 in regions]
+    start = time.perf_counter()
+    reader.recognize(img, horizontal_list=horizontal_list, free_list=[], batch_size=16)
+    unbatched_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    detected = ocr_batch(regions, img, detect=True)
+    detected_time = time.perf_counter() - start
+
+    def accuracy(results):
+        return sum(' '.join(r['text']) == v for r, v in zip(results, values)) / len(values)
+
+    print(f"{len(regions)} fields, recognizer on {reader.device}")
+    print(f"sequential ocr():        {sequential_time:.2f} s, exact {accuracy(sequential):.0%}")
+    print(f"ocr_batch():             {batched_time:.2f} s, exact {accuracy(batched):.0%}, "
+          f"x{sequential_time / batched_time:.1f}")
+    print(f"Reader.recognize():      {unbatched_time:.2f} s (no detection"
+          f"{', one box at a time' if reader.device == 'cpu' else ''}), x{sequential_time / unbatched_time:.1f}")
+    print(f"ocr_batch(detect=True):  {detected_time:.2f} s, exact {accuracy(detected):.0%}, "
+          f"x{sequential_time / detected_time:.1f}")
+
+if __name__ == '__main__':
+    main()
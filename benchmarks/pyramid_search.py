@@ -0,0 +1,58 @@
+"""
+Benchmark: full-resolution vs pyramid template search in get_img_center_coords.
+
+Run from the directory that contains the PyAutomate package:
+
+    python -m PyAutomate.benchmarks.pyramid_search
+"""
+import time
+import cv2
+import numpy as np
+from ..vision.registry import Template
+from ..vision.template import get_img_center_coords
+
+RESOLUTIONS = {'1080p': (1920, 1080), '4K': (3840, 2160)}
+RUNS = 5
+
+def synthetic_screen(width, height, seed=0):
+    """Build a UI-like frame: flat panels, boxes and text on a light background."""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width, 3), 235, dtype=np.uint8)
+    for _ in range(width * height // 20000):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(0, height - 60))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.rectangle(img, (x, y), (x + int(rng.integers(20, 200)), y + int(rng.integers(10, 60))), color, -1)
+    for _ in range(width * height // 40000):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(20, height))
+        cv2.putText(img, f"Item {int(rng.integers(0, 10000))}", (x, y),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (20, 20, 20), 1, cv2.LINE_AA)
+    return img
+
+def place_icon(img, x, y, size=48):
+    icon = np.full((size, size, 3), 250, dtype=np.uint8)
+    cv2.circle(icon, (size // 2, size // 2), size // 3, (40, 90, 200), -1)
+    cv2.line(icon, (8, 8), (size - 8, size - 8), (0, 0, 0), 3)
+    cv2.putText(icon, "OK", (size // 4, size - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+    img[y:y + size, x:x + size] = icon
+    return icon
+
+def time_search(template, screen, pyramid):
+    coords = None
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        coords = get_img_center_coords(template, None, screen, pyramid=pyramid)
+    return coords, (time.perf_counter() - start) / RUNS
+
+def main():
+    for name, (width, height) in RESOLUTIONS.items():
+        screen = synthetic_screen(width, height)
+        icon = place_icon(screen, width * 2 // 3, height // 2)
+        template = Template(icon)
+        full_coords, full_time = time_search(template, screen, pyramid=False)
+        pyr_coords, pyr_time = time_search(template, screen, pyramid=True)
+        print(f"{name}: full {full_time * 1000:.1f} ms -> {full_coords}, "
+              f"pyramid {pyr_time * 1000:.1f} ms -> {pyr_coords}, "
+              f"speedup x{full_time / pyr_time:.1f}, same result: {full_coords == pyr_coords}")
+
+if __name__ == '__main__':
+    main()
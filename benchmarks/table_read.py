@@ -0,0 +1,106 @@
+"""
+Benchmark: read(..., 'table_data' / 'table_dict') against the old per-cell reads.
+
+Builds a local HTML table fixture, opens it in a headless browser and reads it
+both ways, checking that the outputs are identical. Both sides run the same
+stable-list wait with the same arguments; the cell extraction is also timed on
+its own, on one shared list of rows.
+
+Run from the directory that contains the PyAutomate package:
+
+    python -m PyAutomate.benchmarks.table_read [--rows 500] [--cols 10]
+"""
+import argparse
+import os
+import tempfile
+import time
+from selenium.webdriver.common.by import By
+from ..core.browser import init_driver, close_driver, read, get_selector_type, wait_for_stable_elements, _read_table
+
+def write_fixture(path, rows, cols):
+    """
+    Write an HTML page with a `rows` x `cols` table (plus a <th> header row). Cells
+    have padding whitespace, and every third one a non-breaking space and a line break,
+    so the text normalization of both paths is compared too.
+    """
+    lines = ['<!DOCTYPE html><html><body><table id="data">',
+             '<tr>' + ''.join(f'<th>Header {c + 1}</th>' for c in range(cols)) + '</tr>']
+    for r in range(rows):
+        lines.append('<tr>' + ''.join(f'<td> r{r}&nbsp;c{c}<br> x </td>' if (r + c) % 3 == 0 else f'<td> r{r}c{c} </td>'
+                                      for c in range(cols)) + '</tr>')
+    lines.append('</table></body></html>')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+def cells_per_cell(rows):
+    """Cell texts read one WebElement.text call at a time."""
+    data = []
+    for row in rows:
+        cells = row.find_elements(By.TAG_NAME, "td") or row.find_elements(By.TAG_NAME, "th")
+        texts = [c.text.strip() for c in cells]
+        if texts:
+            data.append(texts)
+    return data
+
+def read_per_cell(driver, selector, content_type, stable_time, timeout):
+    """The table_data / table_dict reads as they were done before the bulk script."""
+    rows = wait_for_stable_elements(driver, get_selector_type("xpath"), f"{selector}//tr",
+                                    stable_time=stable_time, timeout=timeout)
+    data = cells_per_cell(rows)
+    if content_type == "table_data":
+        return data
+    if rows and rows[0].find_elements(By.TAG_NAME, "th"):
+        headers = [c.text.strip() for c in rows[0].find_elements(By.TAG_NAME, "th")]
+        data_rows = data[1:]
+    else:
+        headers = [f"Column_{i+1}" for i in range(len(data[0]) if data else 0)]
+        data_rows = data
+    return [dict(zip(headers, v)) if len(v) == len(headers) else {f"Column_{i+1}": t for i, t in enumerate(v)}
+            for v in data_rows]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Table read benchmark")
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--cols', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    stable_time = 0.2
+    timeout = 20
+    selector = '//table[@id="data"]'
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'table.html')
+        write_fixture(path, args.rows, args.cols)
+        driver = init_driver(headless=True)
+        try:
+            driver.get('file:///' + path.replace(os.sep, '/').lstrip('/'))
+
+            rows = wait_for_stable_elements(driver, get_selector_type("xpath"), f"{selector}//tr",
+                                            stable_time=stable_time, timeout=timeout)
+            start = time.perf_counter()
+            cell_data = cells_per_cell(rows)
+            per_cell_extract = time.perf_counter() - start
+            start = time.perf_counter()
+            bulk_data, _ = _read_table(driver, rows)
+            bulk_extract = time.perf_counter() - start
+
+            start = time.perf_counter()
+            old_data = read_per_cell(driver, selector, "table_data", stable_time, timeout)
+            old_dicts = read_per_cell(driver, selector, "table_dict", stable_time, timeout)
+            per_cell_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            data = read("xpath", selector, "table_data", driver=driver, timeout=timeout, stable_time=stable_time)
+            dicts = read("xpath", selector, "table_dict", driver=driver, timeout=timeout, stable_time=stable_time)
+            bulk_time = time.perf_counter() - start
+        finally:
+            close_driver(driver)
+
+    print(f"{args.rows}x{args.cols} table")
+    print(f"cell extraction only (same rows):  per-cell {per_cell_extract:.2f} s, "
+          f"bulk script {bulk_extract:.2f} s, x{per_cell_extract / bulk_extract:.1f}")
+    print(f"full reads (same {stable_time}s stable-list wait on both sides):  per-cell {per_cell_time:.2f} s, "
+          f"read() {bulk_time:.2f} s, x{per_cell_time / bulk_time:.1f}")
+    print(f"identical output: {cell_data == bulk_data and data == old_data and dicts == old_dicts}")
+
+if __name__ == '__main__':
+    main()
@@ -1,62 +1,519 @@
-import easyocr
+import threading
+import time
 import numpy as np
 import cv2
+from ..debug import debug_print as _debug_print
+from .ocr_cache import OCRCache, image_key
+from .ocr_result import OCRResult
+
+class OCRProfile:
+    """
+    Named EasyOCR configuration.
+
+    Readers are cached per language set, recognizer and device, so profiles that only
+    differ in detector settings share one loaded model.
+
+    Args:
+        name: Profile name
+        languages: EasyOCR language codes
+        recog_network: Recognizer model name
+        gpu: Use the GPU when one is available
+        cpu_threads: Torch CPU thread count (None = torch default)
+        canvas_size: Maximum image side passed to the text detector
+        mag_ratio: Image magnification applied before detection
+        text_threshold: Detector text confidence threshold
+        low_text: Detector text lower-bound score
+        link_threshold: Detector link confidence threshold
+    """
+    __slots__ = ('name', 'languages', 'recog_network', 'gpu', 'cpu_threads',
+                 'canvas_size', 'mag_ratio', 'text_threshold', 'low_text', 'link_threshold')
+
+    def __init__(self, name, languages=('en',), recog_network='english_g2', gpu=True, cpu_threads=None,
+                 canvas_size=2560, mag_ratio=1.0, text_threshold=0.7, low_text=0.4, link_threshold=0.4):
+        self.name = name
+        self.languages = tuple(languages)
+        self.recog_network = recog_network
+        self.gpu = gpu
+        self.cpu_threads = cpu_threads
+        self.canvas_size = canvas_size
+        self.mag_ratio = mag_ratio
+        self.text_threshold = text_threshold
+        self.low_text = low_text
+        self.link_threshold = link_threshold
+
+    def settings(self):
+        """All settings as a dict, accepted back by OCRProfile(**settings)."""
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def reader_key(self):
+        """Values identifying the loaded reader."""
+        return (self.languages, self.recog_network, bool(self.gpu))
+
+    def readtext_kwargs(self):
+        """Detector arguments passed to readtext()."""
+        return {'canvas_size': self.canvas_size, 'mag_ratio': self.mag_ratio, 'text_threshold': self.text_threshold,
+                'low_text': self.low_text, 'link_threshold': self.link_threshold}
+
+    def key(self):
+        """Values that change OCR output, part of every cache key."""
+        return self.reader_key() + tuple(self.readtext_kwargs().values())
+
+    def __repr__(self):
+        return f"OCRProfile({self.name!r}, languages={list(self.languages)}, recog_network={self.recog_network!r}, gpu={self.gpu})"
+
+_profiles = {
+    # Japanese + English, the configuration used before profiles existed
+    'ja': OCRProfile('ja', ['ja', 'en'], 'japanese_g2', gpu=True),
+    # English only: smaller recognizer, no Japanese model in memory
+    'en': OCRProfile('en', ['en'], 'english_g2', gpu=True),
+    # English only on CPU hosts, with a smaller detector input
+    'en_cpu': OCRProfile('en_cpu', ['en'], 'english_g2', gpu=False, canvas_size=1280),
+}
+_session_profile = 'ja'
 
 # Global variables
-reader = None
+reader = None  # Reader of the session profile, once loaded
 last_screenshot_region = None
+_readers = {}
+_init_lock = threading.Lock()
+_warm_up_threads = {}
+_cpu_threads = None
+
+def register_ocr_profile(name: str, **settings):
+    """
+    Add or replace a named OCR profile.
+
+    Args:
+        name: Profile name, usable wherever a profile is accepted
+        **settings: OCRProfile arguments (languages, recog_network, gpu, cpu_threads,
+                    canvas_size, mag_ratio, text_threshold, low_text, link_threshold)
+
+    Returns:
+        The new OCRProfile
+    """
+    profile = OCRProfile(name, **settings)
+    _profiles[name] = profile
+    return profile
+
+def get_ocr_profile(profile=None):
+    """
+    Resolve a profile name or OCRProfile; None returns the session profile.
+
+    Raises:
+        KeyError: If no profile has that name
+    """
+    if isinstance(profile, OCRProfile):
+        return profile
+    name = _session_profile if profile is None else profile
+    if name not in _profiles:
+        raise KeyError(f"Unknown OCR profile: {name!r} (available: {', '.join(_profiles)})")
+    return _profiles[name]
+
+def set_ocr_profile(profile):
+    """
+    Set the profile used when an OCR call doesn't name one.
+
+    Args:
+        profile: Profile name or OCRProfile
+    """
+    global _session_profile, reader
+    profile = get_ocr_profile(profile)
+    _profiles.setdefault(profile.name, profile)
+    _session_profile = profile.name
+    reader = _readers.get(profile.reader_key())
+    _debug_print(f"OCR profile set to {profile.name}")
 
-def initialize_ocr():
-    """Initialize the EasyOCR reader if not already initialized."""
+def initialize_ocr(profile=None):
+    """
+    Initialize the EasyOCR reader for a profile (default: the session profile) if not already initialized.
+    easyocr (and torch) are only imported here, so they are not loaded until OCR is used.
+    """
     global reader
-    if reader is not None:
-        print("EasyOCR already initialized")
-        return True
-        
+    profile = get_ocr_profile(profile)
+    key = profile.reader_key()
+    with _init_lock:
+        if key in _readers:
+            print("EasyOCR already initialized")
+            return True
+
+        try:
+            import easyocr
+            _readers[key] = easyocr.Reader(
+                list(profile.languages),
+                gpu=profile.gpu,
+                model_storage_directory='./models',
+                download_enabled=True,
+                recog_network=profile.recog_network
+            )
+            if key == get_ocr_profile().reader_key():
+                reader = _readers[key]
+            print(f"EasyOCR initialized successfully ({profile.name})")
+            return True
+        except Exception as e:
+            print(f"Error initializing EasyOCR: {e}")
+            return False
+
+def warm_up_ocr(profile=None):
+    """
+    Initialize the EasyOCR reader for a profile on a background thread.
+    An ocr() call made before it finishes waits for it instead of loading a second reader.
+    """
+    profile = get_ocr_profile(profile)
+    key = profile.reader_key()
+    if key in _readers:
+        return None
+    thread = _warm_up_threads.get(key)
+    if thread is None or not thread.is_alive():
+        thread = threading.Thread(target=initialize_ocr, args=(profile,), name="PyAutomateOCRWarmUp", daemon=True)
+        _warm_up_threads[key] = thread
+        thread.start()
+    return thread
+
+def is_ocr_initialized(profile=None):
+    """Check if EasyOCR is initialized for a profile (default: the session profile)."""
+    return get_ocr_profile(profile).reader_key() in _readers
+
+def _get_reader(profile):
+    """Return the loaded reader for a profile, loading it if needed. None if it can't be loaded."""
+    global _cpu_threads
+    key = profile.reader_key()
+    if key not in _readers and not initialize_ocr(profile):
+        return None
+    if profile.cpu_threads and profile.cpu_threads != _cpu_threads:
+        import torch
+        torch.set_num_threads(profile.cpu_threads)
+        _cpu_threads = profile.cpu_threads
+    return _readers[key]
+
+def _empty_result():
+    return {'text':[],'left':[],'top':[],'width':[],'height':[],'conf':[]}
+
+def _results_to_data(results):
+    """Convert EasyOCR readtext() output to the ocr() result dict."""
+    data = _empty_result()
+    for bbox, text, prob in results:
+        x1,y1 = bbox[0]; x2,y2 = bbox[2]
+        data['text'].append(text)
+        data['left'].append(int(x1))
+        data['top'].append(int(y1))
+        data['width'].append(int(x2-x1))
+        data['height'].append(int(y2-y1))
+        data['conf'].append(int(prob*100))
+    return data
+
+# OCR server client state (see capture/ocr_server.py)
+_server_enabled = False
+_server_address = None
+_server_client = None
+_server_retry_at = 0.0
+_server_lock = threading.Lock()
+SERVER_RETRY_INTERVAL = 5.0  # Seconds between attempts to reach a server that wasn't running
+
+def use_ocr_server(enabled: bool = True, address=None):
+    """
+    Enable or disable the local OCR server (off by default). When enabled, ocr() sends
+    images to the user's running server and only loads a reader in this process if none
+    is found or the server doesn't have the requested profile.
+
+    Args:
+        enabled: Whether ocr() should try the server
+        address: Optional server address (defaults to ocr_server.default_address())
+    """
+    global _server_enabled, _server_address, _server_client, _server_retry_at
+    with _server_lock:
+        _server_enabled = enabled
+        _server_address = address
+        _server_retry_at = 0.0
+        if _server_client is not None:
+            _server_client.close()
+            _server_client = None
+
+def _server_ocr(img, profile):
+    """Run OCR through the local server. Returns None when no server is reachable."""
+    global _server_client, _server_retry_at
+    if not _server_enabled:
+        return None
+    with _server_lock:
+        if _server_client is None:
+            if time.monotonic() < _server_retry_at:
+                return None
+            try:
+                from .ocr_server import OCRClient
+                _server_client = OCRClient(_server_address)
+            except Exception as e:
+                _debug_print(f"OCR server not available: {e}", level=2)
+                _server_retry_at = time.monotonic() + SERVER_RETRY_INTERVAL
+                return None
+        client = _server_client
+    try:
+        return client.ocr(img, profile)
+    except LookupError as e:
+        _debug_print(f"OCR server can't serve this profile, using local OCR: {e}", level=2)
+        return None
+    except (OSError, EOFError) as e:
+        print(f"OCR server error, falling back to local OCR: {e}")
+        with _server_lock:
+            if _server_client is client:
+                _server_client = None
+                _server_retry_at = time.monotonic() + SERVER_RETRY_INTERVAL
+        client.close()
+        return None
+
+def _recognize(img, profile):
+    """Run OCR on a BGR image through the server or the local reader. Returns the result dict or None."""
+    data = _server_ocr(img, profile)
+    if data is None:
+        local_reader = _get_reader(profile)
+        if local_reader is None:
+            return None
+        data = _results_to_data(local_reader.readtext(img, **profile.readtext_kwargs()))
+    return data
+
+# Opt-in whole-image OCR result cache
+_result_cache = None
+# Used by ocr(cache=True) calls while the global cache is disabled, without enabling it
+_call_cache = OCRCache(maxsize=64)
+
+def enable_ocr_cache(maxsize: int = 64):
+    """
+    Memoize ocr() results by image content and reader configuration, so identical
+    frames skip the neural network. Replaces any existing cache.
+    """
+    global _result_cache
+    _result_cache = OCRCache(maxsize=maxsize)
+    return _result_cache
+
+def disable_ocr_cache():
+    """Turn off ocr() memoization and drop the cached results (including those of cache=True calls)."""
+    global _result_cache
+    _result_cache = None
+    _call_cache.clear()
+
+def ocr_cache_stats():
+    """Hit/miss counters and size of the ocr() cache, or None when it is disabled."""
+    cache = _result_cache
+    return cache.stats() if cache is not None else None
+
+def ocr(img: np.ndarray, region: dict = None, cache: bool = None, profile=None):
+    """
+    Perform OCR on the given image.
+    Uses the local OCR server when one is running, otherwise the reader in this
+    process, which is loaded on the first call.
+
+    Args:
+        img: Image to read (BGR or gray)
+        region: Optional screen region the image was taken from
+        cache: Use the result cache (None = only if enabled with enable_ocr_cache()).
+               True without an enabled cache uses a cache shared only by cache=True calls.
+        profile: OCR profile name or OCRProfile (default: the session profile)
+
+    Returns:
+        OCRResult (dict-compatible: 'text', 'left', 'top', 'width', 'height', 'conf')
+    """
     try:
-        reader = easyocr.Reader(
-            ['ja', 'en'],
-            gpu=True, 
-            model_storage_directory='./models',
-            download_enabled=True,
-            recog_network='japanese_g2'
-        )
-        print("EasyOCR initialized successfully")
-        return True
+        profile = get_ocr_profile(profile)
+        if img.ndim==2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        result_cache = _result_cache if cache is not False else None
+        if cache and result_cache is None:
+            result_cache = _call_cache
+        key = None
+        data = None
+        if result_cache is not None:
+            key = image_key(img, *profile.key())
+            data = result_cache.get(key)
+        if data is None:
+            data = _recognize(img, profile)
+            if data is None:
+                return OCRResult(region=region)
+            if key is not None:
+                result_cache.put(key, data)
+        if region:
+            global last_screenshot_region
+            last_screenshot_region = region
+        return OCRResult.from_dict(data, region)
     except Exception as e:
-        print(f"Error initializing EasyOCR: {e}")
-        reader = None
-        return False
-
-def is_ocr_initialized():
-    """Check if EasyOCR is initialized."""
-    return reader is not None
-
-def ocr(img: np.ndarray, region: dict = None):
-    """Perform OCR on the given image."""
-    if not is_ocr_initialized():
-        print("EasyOCR not initialized. Call initialize_ocr() first.")
-        return {'text':[],'left':[],'top':[],'width':[],'height':[],'conf':[]}
-        
+        print(f"OCR error: {e}")
+        return OCRResult(region=region)
+
+# Tile-level OCR cache
+_tile_cache = OCRCache(maxsize=512)
+TILE_HEIGHT = 320   # Band height in pixels of the image passed to ocr_tiles
+TILE_OVERLAP = 80   # Rows shared by neighbouring bands, must exceed the tallest text line
+
+def get_ocr_tile_cache():
+    """Return the tile-level OCR cache used by ocr_tiles()."""
+    return _tile_cache
+
+def ocr_tiles(img: np.ndarray, region: dict = None, tile_height: int = TILE_HEIGHT,
+              overlap: int = TILE_OVERLAP, cache: OCRCache = None, profile=None):
+    """
+    Perform OCR band by band, reusing cached results for bands whose pixels didn't change.
+
+    The image is cut into full-width horizontal bands that overlap by `overlap` rows.
+    Each band is keyed by a content hash, so text in unchanged parts of the screen is
+    never recognized twice. A detection is kept only by the band whose core (the band
+    minus half the overlap on each inner side) contains its vertical center.
+    `profile` selects the OCR profile as in ocr().
+
+    Returns:
+        OCRResult like ocr(), in full-image coordinates.
+    """
+    if cache is None:
+        cache = _tile_cache
     try:
         if img.ndim==2:
             img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
-        results = reader.readtext(img)
-        data = {'text':[],'left':[],'top':[],'width':[],'height':[],'conf':[]}
-        for bbox, text, prob in results:
-            x1,y1 = bbox[0]; x2,y2 = bbox[2]
-            data['text'].append(text)
-            data['left'].append(int(x1))
-            data['top'].append(int(y1))
-            data['width'].append(int(x2-x1))
-            data['height'].append(int(y2-y1))
-            data['conf'].append(int(prob*100))
+        h = img.shape[0]
+        overlap = min(overlap, tile_height // 2)
+        stride = tile_height - overlap
+        profile = get_ocr_profile(profile)
+        data = _empty_result()
+        config = profile.key()
+        y0 = 0
+        while True:
+            y1 = min(h, y0 + tile_height)
+            band = img[y0:y1]
+            key = image_key(band, *config)
+            band_data = cache.get(key)
+            if band_data is None:
+                band_data = _recognize(np.ascontiguousarray(band), profile)
+                if band_data is None:
+                    return OCRResult(region=region)
+                cache.put(key, band_data)
+            core_top = y0 + overlap // 2 if y0 > 0 else 0
+            core_bottom = y0 + stride + overlap // 2 if y1 < h else h
+            for i, text in enumerate(band_data['text']):
+                center_y = y0 + band_data['top'][i] + band_data['height'][i] / 2
+                if core_top <= center_y < core_bottom:
+                    for k in data:
+                        value = band_data[k][i]
+                        data[k].append(value + y0 if k == 'top' else value)
+            if y1 >= h:
+                break
+            y0 += stride
         if region:
             global last_screenshot_region
             last_screenshot_region = region
-        return data
+        return OCRResult.from_dict(data, region)
+    except Exception as e:
+        print(f"OCR error: {e}")
+        return OCRResult(region=region)
+
+def _clip_box(box, width, height):
+    x1, y1, x2, y2 = (int(v) for v in box)
+    return max(0, x1), max(0, y1), min(width, x2), min(height, y2)
+
+def _recognize_boxes(local_reader, img, horizontal_list, batch_size):
+    """
+    Recognize fixed text boxes in batched recognizer calls.
+
+    Reader.recognize() goes box by box on the CPU whatever the batch size, so the
+    crops are prepared once and passed to EasyOCR's get_text() together, as its GPU
+    path does. Falls back to Reader.recognize() where the internals differ (other
+    EasyOCR versions, right-to-left models).
+
+    Returns:
+        [(bbox, text, prob)] like Reader.recognize()
+    """
+    try:
+        from easyocr import easyocr as _easyocr
+        from easyocr.recognition import get_text
+        from easyocr.utils import get_image_list
+        if local_reader.model_lang == 'arabic':
+            raise AttributeError("right-to-left output needs Reader.recognize")
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        image_list, max_width = get_image_list(horizontal_list, [], gray, model_height=_easyocr.imgH)
+        ignore_char = ''.join(set(local_reader.character) - set(local_reader.lang_char))
+    except (ImportError, AttributeError) as e:
+        _debug_print(f"Batched recognition unavailable, using Reader.recognize: {e}", level=2)
+        return local_reader.recognize(img, horizontal_list=horizontal_list, free_list=[], batch_size=batch_size)
+    if not image_list:
+        return []
+    return get_text(local_reader.character, _easyocr.imgH, int(max_width), local_reader.recognizer,
+                    local_reader.converter, image_list, ignore_char, batch_size=batch_size, workers=0,
+                    device=local_reader.device)
+
+def ocr_batch(regions, img: np.ndarray = None, detect: bool = False, batch_size: int = 16, profile=None):
+    """
+    Read many small regions of one frame in batched recognizer calls.
+
+    With detect=False (the default) each region is treated as one text field: the
+    crops skip text detection and all of them go through EasyOCR's recognizer in
+    batches of `batch_size`, on the CPU too (Reader.recognize() would read them one
+    at a time there). With detect=True the crops are padded to one size and
+    run through readtext_batched(), which also finds several text blocks per region.
+
+    Always uses the reader in this process, not the OCR server.
+
+    Args:
+        regions: List of (x1, y1, x2, y2) boxes, in screen coordinates when img is None,
+                 otherwise in img coordinates
+        img: Optional BGR frame to crop from (a screenshot is taken if None)
+        detect: Run text detection inside each region
+        batch_size: Recognizer batch size
+        profile: OCR profile name or OCRProfile (default: the session profile)
+
+    Returns:
+        List of OCRResults, one per region, with coordinates relative to the region.
+    """
+    results = [_empty_result() for _ in regions]
+    if not regions:
+        return [OCRResult.from_dict(r) for r in results]
+    try:
+        if img is None:
+            from .screenshot import screenshot
+            img, frame_region = screenshot()
+            regions = [(x1 - frame_region['left'], y1 - frame_region['top'],
+                        x2 - frame_region['left'], y2 - frame_region['top']) for x1, y1, x2, y2 in regions]
+        if img.ndim==2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        profile = get_ocr_profile(profile)
+        local_reader = _get_reader(profile)
+        if local_reader is None:
+            return [OCRResult.from_dict(r) for r in results]
+        height, width = img.shape[:2]
+        boxes = [_clip_box(box, width, height) for box in regions]
+        valid = [i for i, (x1, y1, x2, y2) in enumerate(boxes) if x2 > x1 and y2 > y1]
+        if not valid:
+            return [OCRResult.from_dict(r) for r in results]
+
+        if detect:
+            crop_h = max(boxes[i][3] - boxes[i][1] for i in valid)
+            crop_w = max(boxes[i][2] - boxes[i][0] for i in valid)
+            crops = []
+            for i in valid:
+                x1, y1, x2, y2 = boxes[i]
+                crops.append(cv2.copyMakeBorder(img[y1:y2, x1:x2], 0, crop_h - (y2 - y1), 0, crop_w - (x2 - x1),
+                                                cv2.BORDER_REPLICATE))
+            batched = local_reader.readtext_batched(crops, batch_size=batch_size, **profile.readtext_kwargs())
+            for i, region_results in zip(valid, batched):
+                results[i] = _results_to_data(region_results)
+            return [OCRResult.from_dict(r) for r in results]
+
+        # Recognition only: EasyOCR returns boxes sorted by position, so map them back by coordinates
+        horizontal_list = [[boxes[i][0], boxes[i][2], boxes[i][1], boxes[i][3]] for i in valid]
+        owners = {}
+        for i in valid:
+            owners.setdefault(boxes[i], []).append(i)
+        recognized = _recognize_boxes(local_reader, img, horizontal_list, batch_size)
+        for bbox, text, prob in recognized:
+            (x1, y1), (x2, y2) = bbox[0], bbox[2]
+            indices = owners.get((int(x1), int(y1), int(x2), int(y2)))
+            if not indices or not text.strip():
+                continue
+            i = indices.pop(0)
+            data = results[i]
+            data['text'].append(text)
+            data['left'].append(0)
+            data['top'].append(0)
+            data['width'].append(int(x2 - x1))
+            data['height'].append(int(y2 - y1))
+            data['conf'].append(int(prob*100))
+        return [OCRResult.from_dict(r) for r in results]
     except Exception as e:
         print(f"OCR error: {e}")
-        return {'text':[],'left':[],'top':[],'width':[],'height':[],'conf':[]}
+        return [OCRResult.from_dict(r) for r in results]
 
-__all__ = ['ocr', 'initialize_ocr', 'is_ocr_initialized']
\ No newline at end of file
+__all__ = ['OCRResult', 'OCRProfile', 'register_ocr_profile', 'get_ocr_profile', 'set_ocr_profile', 'ocr', 'ocr_batch', 'ocr_tiles', 'get_ocr_tile_cache',
+           'enable_ocr_cache', 'disable_ocr_cache', 'ocr_cache_stats', 'initialize_ocr', 'warm_up_ocr', 'is_ocr_initialized', 'use_ocr_server']
@@ -0,0 +1,61 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+def image_key(img, *config):
+    """
+    Fast content hash of an image array plus any extra configuration values.
+    Two arrays with the same pixels, shape and dtype get the same key.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((img.shape, img.dtype.str, config)).encode())
+    h.update(memoryview(img if img.flags['C_CONTIGUOUS'] else img.copy()).cast('B'))
+    return h.hexdigest()
+
+class OCRCache:
+    """
+    Size-bounded LRU cache of OCR results with hit/miss counters.
+
+    Args:
+        maxsize: Maximum number of cached results
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached result for `key`, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
+
+__all__ = ['OCRCache', 'image_key']
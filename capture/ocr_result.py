@@ -0,0 +1,118 @@
+from collections.abc import Mapping
+import numpy as np
+
+_KEYS = ('text', 'left', 'top', 'width', 'height', 'conf')
+_NUMERIC_KEYS = _KEYS[1:]
+
+class OCRResult(Mapping):
+    """
+    Columnar OCR result.
+
+    Behaves like the dict returned by ocr() before (same keys, indexable and zippable
+    columns), but keeps the numeric columns in NumPy arrays and builds lookup indexes
+    on first use, so repeated lookups against one OCR pass are cheap.
+
+    Attributes:
+        text: List of recognized strings
+        left, top, width, height: int32 arrays with the box of each string
+        conf: int32 array with the confidence (0-100) of each string
+        region: Screen region the OCR image was taken from, if known
+    """
+    __slots__ = ('text', 'left', 'top', 'width', 'height', 'conf', 'region',
+                 '_exact', '_joined', '_offsets')
+
+    def __init__(self, text=(), left=(), top=(), width=(), height=(), conf=(), region=None):
+        self.text = list(text)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.top = np.asarray(top, dtype=np.int32)
+        self.width = np.asarray(width, dtype=np.int32)
+        self.height = np.asarray(height, dtype=np.int32)
+        self.conf = np.asarray(conf, dtype=np.int32)
+        self.region = region
+        self._exact = None
+        self._joined = None
+        self._offsets = None
+
+    @classmethod
+    def from_dict(cls, data, region=None):
+        """Build a result from an ocr()-style dict of lists."""
+        if isinstance(data, OCRResult):
+            return data
+        return cls(*(data[k] for k in _KEYS), region=region)
+
+    def to_dict(self):
+        """Plain dict of Python lists, e.g. for JSON or pickling to older code."""
+        return {'text': list(self.text), **{k: getattr(self, k).tolist() for k in _NUMERIC_KEYS}}
+
+    # Mapping interface, for code written against the old dict result
+    def __getitem__(self, key):
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(_KEYS)
+
+    def __len__(self):
+        return len(_KEYS)
+
+    @property
+    def size(self):
+        """Number of recognized strings."""
+        return len(self.text)
+
+    def __repr__(self):
+        return f"OCRResult({self.size} strings: {self.text[:5]!r}{'...' if self.size > 5 else ''})"
+
+    # Text lookup
+    def find(self, text):
+        """Indices of strings exactly equal to `text`, in detection order."""
+        if self._exact is None:
+            exact = {}
+            for i, t in enumerate(self.text):
+                exact.setdefault(t, []).append(i)
+            self._exact = exact
+        return list(self._exact.get(text, ()))
+
+    def find_substring(self, text, min_conf=None):
+        """Indices of strings containing `text`, in detection order, optionally above a confidence."""
+        if not text or '\x00' in text:
+            return [i for i, t in enumerate(self.text) if text in t and (min_conf is None or self.conf[i] > min_conf)]
+        if self._joined is None:
+            # One string with a separator between entries, scanned with str.find in C
+            self._joined = '\x00'.join(self.text)
+            lengths = np.fromiter((len(t) + 1 for t in self.text), dtype=np.int64, count=len(self.text))
+            self._offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else lengths
+        indices = []
+        pos = self._joined.find(text)
+        while pos != -1:
+            i = int(np.searchsorted(self._offsets, pos, side='right')) - 1
+            if min_conf is None or self.conf[i] > min_conf:
+                indices.append(i)
+            # Continue after the end of this entry so each index is reported once
+            pos = self._joined.find(text, int(self._offsets[i]) + len(self.text[i]) + 1)
+        return indices
+
+    # Spatial queries (in the coordinates of the OCR image)
+    def centers(self):
+        """(cx, cy) float arrays with the box center of every string."""
+        return self.left + self.width / 2, self.top + self.height / 2
+
+    def within(self, x1, y1, x2, y2):
+        """Indices of strings whose box center lies inside (x1, y1, x2, y2)."""
+        cx, cy = self.centers()
+        return np.nonzero((cx >= x1) & (cx < x2) & (cy >= y1) & (cy < y2))[0].tolist()
+
+    def nearest(self, x, y, text=None):
+        """
+        Index of the string whose box center is nearest to (x, y), or None.
+        With `text`, only strings containing it are considered.
+        """
+        candidates = np.arange(self.size) if text is None else np.asarray(self.find_substring(text), dtype=np.int64)
+        if len(candidates) == 0:
+            return None
+        cx, cy = self.centers()
+        d2 = (cx[candidates] - x) ** 2 + (cy[candidates] - y) ** 2
+        return int(candidates[np.argmin(d2)])
+
+__all__ = ['OCRResult']
@@ -0,0 +1,312 @@
+"""
+Local OCR server.
+
+Holds warm EasyOCR readers for the automation processes of one user, one per OCR
+profile in use. Clients pass frames and a profile name through shared memory and
+receive the same result dict as ocr(). Requests that arrive together are batched
+into one readtext_batched() call per frame size and profile.
+
+The socket lives in a per-user directory only the user can access, and both sides
+authenticate with a random key stored there (see default_address() and
+get_authkey()), so other local users can neither reach the server nor pose as it.
+
+Start it with:
+
+    python -m PyAutomate.capture.ocr_server [--address ADDRESS] [--profile NAME]
+
+and enable it in the automation processes with use_ocr_server().
+"""
+import argparse
+import os
+import queue
+import secrets
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import shared_memory
+from multiprocessing.connection import Listener, Client
+import numpy as np
+from . import ocr as _ocr
+from ..debug import debug_print as _debug_print
+
+KEY_FILE = 'ocr-server.key'
+
+def _private_dir():
+    """
+    Per-user directory for the socket and key, created with 0700 permissions.
+
+    Raises:
+        PermissionError: If the directory is owned by someone else or open to other users
+    """
+    if sys.platform == 'win32':
+        path = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'PyAutomate')
+        os.makedirs(path, exist_ok=True)
+        return path
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime and os.path.isdir(runtime) and os.stat(runtime).st_uid == os.getuid():
+        path = os.path.join(runtime, 'pyautomate')
+    else:
+        path = os.path.join(tempfile.gettempdir(), f'pyautomate-{os.getuid()}')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} must be a directory owned by this user with 0700 permissions")
+    return path
+
+def default_address():
+    """Server address of the current user (named pipe on Windows, Unix socket elsewhere)."""
+    if sys.platform == 'win32':
+        return r'\\.\pipe\pyautomate-ocr-' + (os.environ.get('USERNAME') or 'user')
+    return os.path.join(_private_dir(), 'ocr.sock')
+
+def get_authkey():
+    """
+    Random authentication key of the current user, created on first use in a file
+    only the user can read.
+    """
+    path = os.path.join(_private_dir(), KEY_FILE)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        info = os.stat(path)
+        if sys.platform != 'win32' and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+            raise PermissionError(f"{path} must be owned by this user and not readable by others")
+        with open(path, 'rb') as f:
+            key = f.read()
+        if len(key) < 32:
+            raise PermissionError(f"{path} does not contain a valid key")
+        return key
+    key = secrets.token_bytes(32)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+def _attach(name):
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != 'win32':
+        # The client owns the segment; stop this process's resource tracker from unlinking it
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+class OCRClient:
+    """
+    Connection to a running OCR server.
+
+    The shared memory segment is kept between calls and only grown when a larger
+    frame is sent. Calls from several threads are serialized.
+
+    Raises:
+        OSError: If no server is listening on the address
+        multiprocessing.AuthenticationError: If the listener doesn't know the user's key
+    """
+    def __init__(self, address=None):
+        self.address = address or default_address()
+        if sys.platform != 'win32' and not os.path.exists(self.address):
+            raise FileNotFoundError(f"No OCR server socket at {self.address}")
+        self._conn = Client(self.address, authkey=get_authkey())
+        self._shm = None
+        self._lock = threading.Lock()
+
+    def _buffer(self, nbytes):
+        if self._shm is None or self._shm.size < nbytes:
+            self._release()
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return self._shm
+
+    def _release(self):
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+    def ocr(self, img, profile=None):
+        """
+        Send one BGR image to the server and return the ocr() result dict.
+        The server reads it with its own profile of the same name.
+
+        Raises:
+            LookupError: If the server has no profile with that name
+        """
+        img = np.ascontiguousarray(img)
+        name = _ocr.get_ocr_profile(profile).name
+        with self._lock:
+            shm = self._buffer(img.nbytes)
+            np.ndarray(img.shape, dtype=img.dtype, buffer=shm.buf)[...] = img
+            self._conn.send(('ocr', shm.name, img.shape, img.dtype.str, name))
+            status, payload = self._conn.recv()
+        if status == 'unknown_profile':
+            raise LookupError(payload)
+        if status != 'ok':
+            raise OSError(f"OCR server error: {payload}")
+        return payload
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._release()
+
+class OCRServer:
+    """
+    OCR server holding warm readers.
+
+    Args:
+        address: Listener address (default: default_address())
+        batch_window: Seconds to wait for more requests once one has arrived
+        max_batch: Largest number of images recognized in one call
+        profile: OCR profile loaded at startup (other registered profiles are loaded when first requested)
+    """
+    def __init__(self, address=None, batch_window=0.01, max_batch=8, profile=None):
+        self.address = address or default_address()
+        self.profile = _ocr.get_ocr_profile(profile)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._requests = queue.Queue()
+        self._listener = None
+
+    def serve_forever(self):
+        if not _ocr.is_ocr_initialized(self.profile) and not _ocr.initialize_ocr(self.profile):
+            raise RuntimeError("Could not initialize EasyOCR")
+        if sys.platform != 'win32':
+            self._remove_stale_socket()
+        self._listener = Listener(self.address, authkey=get_authkey())
+        if sys.platform != 'win32':
+            os.chmod(self.address, 0o600)
+        threading.Thread(target=self._worker, name="OCRServerWorker", daemon=True).start()
+        print(f"OCR server listening on {self.address}")
+        try:
+            while True:
+                try:
+                    conn = self._listener.accept()
+                except OSError as e:
+                    _debug_print(f"OCR server accept error: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self._listener.close()
+
+    def _remove_stale_socket(self):
+        """
+        Remove a socket left behind by a server that is no longer running.
+
+        Raises:
+            FileExistsError: If the path is not our socket, or a server is still listening on it
+        """
+        try:
+            info = os.lstat(self.address)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+            raise FileExistsError(f"{self.address} exists and is not a socket owned by this user")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.address)
+        except ConnectionRefusedError:
+            os.unlink(self.address)
+            return
+        finally:
+            probe.close()
+        raise FileExistsError(f"An OCR server is already listening on {self.address}")
+
+    def _handle(self, conn):
+        send_lock = threading.Lock()
+        try:
+            while True:
+                request = conn.recv()
+                if request[0] == 'ping':
+                    with send_lock:
+                        conn.send(('ok', None))
+                    continue
+                _, name, shape, dtype = request[:4]
+                profile_name = request[4] if len(request) > 4 else None
+                try:
+                    # Only profiles registered in this process: clients can't choose settings
+                    profile = self.profile if profile_name is None else _ocr.get_ocr_profile(str(profile_name))
+                except KeyError as e:
+                    with send_lock:
+                        conn.send(('unknown_profile', str(e)))
+                    continue
+                self._requests.put((conn, send_lock, name, tuple(shape), dtype, profile))
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+
+    def _next_batch(self):
+        batch = [self._requests.get()]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker(self):
+        while True:
+            batch = self._next_batch()
+            # Group by frame shape and profile: readtext_batched needs images of one size
+            groups = {}
+            for request in batch:
+                groups.setdefault((request[3], request[4], request[5].key()), []).append(request)
+            for (shape, dtype, _), requests in groups.items():
+                self._run(requests, shape, dtype, requests[0][5])
+
+    def _run(self, requests, shape, dtype, profile):
+        segments, images = [], []
+        try:
+            reader = _ocr._get_reader(profile)
+            if reader is None:
+                raise RuntimeError(f"Could not load OCR profile {profile.name}")
+            for _, _, name, _, _, _ in requests:
+                shm = _attach(name)
+                segments.append(shm)
+                images.append(np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf))
+            if len(images) == 1:
+                results = [reader.readtext(images[0], **profile.readtext_kwargs())]
+            else:
+                results = reader.readtext_batched(images, batch_size=len(images), **profile.readtext_kwargs())
+            replies = [('ok', _ocr._results_to_data(r)) for r in results]
+            _debug_print(f"OCR server processed {len(images)} image(s) of {shape} ({profile.name})")
+        except Exception as e:
+            replies = [('error', str(e))] * len(requests)
+        finally:
+            del images
+            for shm in segments:
+                shm.close()
+        for (conn, send_lock, _, _, _, _), reply in zip(requests, replies):
+            try:
+                with send_lock:
+                    conn.send(reply)
+            except OSError:
+                pass
+
+def serve_ocr(address=None, batch_window=0.01, max_batch=8, profile=None):
+    """Run the OCR server in this process (blocks)."""
+    OCRServer(address, batch_window, max_batch, profile).serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyAutomate local OCR server")
+    parser.add_argument('--address', default=None, help="listener address (default: a socket in the user's private directory)")
+    parser.add_argument('--batch-window', type=float, default=0.01, help="seconds to collect concurrent requests")
+    parser.add_argument('--max-batch', type=int, default=8, help="largest batch sent to the recognizer")
+    parser.add_argument('--profile', default=None, help="OCR profile loaded at startup (default: the session profile)")
+    args = parser.parse_args(argv)
+    serve_ocr(args.address, args.batch_window, args.max_batch, args.profile)
+
+__all__ = ['OCRClient', 'OCRServer', 'serve_ocr', 'default_address', 'get_authkey']
+
+if __name__ == '__main__':
+    main()
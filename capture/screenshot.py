@@ -1,18 +1,159 @@
 import mss
 import numpy as np
 import cv2
+import threading
+import time
+import weakref
+from collections import deque
 
 last_screenshot_region = None
 
-def screenshot(x1=None, y1=None, x2=None, y2=None):
-    with mss.mss() as sct:
-        if None not in (x1,y1,x2,y2):
-            region = {"left":x1,"top":y1,"width":x2-x1,"height":y2-y1}
+class CaptureSession:
+    """
+    Long-lived screen capture session.
+
+    Keeps the mss grabber open between frames instead of creating and tearing down
+    an mss context for every screenshot, and records a timestamp for every frame so
+    the real capture rate can be measured.
+
+    mss handles are bound to the thread that created them, so one grabber is kept
+    per thread. A thread's grabber is closed when the thread exits (or earlier with
+    release_thread()), so short-lived threads don't leak capture handles.
+
+    Args:
+        monitor: Index into mss monitors used when no region is given (1 = primary)
+        history: Number of frame timestamps kept for fps()
+    """
+    def __init__(self, monitor=1, history=120):
+        self.monitor = monitor
+        self.frame_times = deque(maxlen=history)
+        self.frame_count = 0
+        self.last_frame_time = None
+        self._local = threading.local()
+        self._grabbers = {}  # id(holder) -> mss handle, for close()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _grabber(self):
+        if self._closed:
+            raise RuntimeError("Capture session is closed")
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = _GrabberHolder(mss.mss())
+            self._local.holder = holder
+            with self._lock:
+                self._grabbers[id(holder)] = holder.sct
+            # The thread-local drops the holder when the thread exits
+            weakref.finalize(holder, self._release, id(holder))
+        return holder.sct
+
+    def _release(self, key):
+        with self._lock:
+            sct = self._grabbers.pop(key, None)
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def release_thread(self):
+        """Close the calling thread's grabber now (a new one is opened on its next grab)."""
+        holder = getattr(self._local, 'holder', None)
+        if holder is not None:
+            self._local.holder = None
+            self._release(id(holder))
+
+    def monitor_region(self):
+        """Return the region dict of the session monitor."""
+        mon = self._grabber().monitors[self.monitor]
+        return {"left":mon['left'],"top":mon['top'],
+                "width":mon['width'],"height":mon['height']}
+
+    def grab(self, region=None, out=None):
+        """
+        Grab one frame.
+
+        Args:
+            region: Optional dict with left/top/width/height (defaults to the session monitor)
+            out: Optional preallocated (height, width, 3) uint8 array to write the frame into
+
+        Returns:
+            (img, region) like screenshot()
+        """
+        sct = self._grabber()
+        if region is None:
+            region = self.monitor_region()
+        shot = sct.grab(region)
+        # View the raw BGRA buffer directly instead of copying it through np.array()
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if out is not None:
+            img = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=out)
         else:
-            mon = sct.monitors[1]
-            region = {"left":mon['left'],"top":mon['top'],
-                      "width":mon['width'],"height":mon['height']}
-        img = np.array(sct.grab(region))
-        if img.shape[2]==4:
-            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        return img, region
\ No newline at end of file
+            img = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+        now = time.perf_counter()
+        with self._lock:
+            self.frame_count += 1
+            self.last_frame_time = now
+            self.frame_times.append(now)
+        return img, region
+
+    def fps(self):
+        """Return the measured capture rate over the recorded frame history."""
+        with self._lock:
+            if len(self.frame_times) < 2:
+                return 0.0
+            elapsed = self.frame_times[-1] - self.frame_times[0]
+            count = len(self.frame_times) - 1
+        return count / elapsed if elapsed > 0 else 0.0
+
+    def close(self):
+        """Close every grabber opened by this session."""
+        with self._lock:
+            self._closed = True
+            grabbers, self._grabbers = list(self._grabbers.values()), {}
+        for sct in grabbers:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+class _GrabberHolder:
+    """Owner of one thread's mss handle, referenced only by the session's thread-local."""
+    __slots__ = ('sct', '__weakref__')
+
+    def __init__(self, sct):
+        self.sct = sct
+
+_default_session = None
+_session_lock = threading.Lock()
+
+def get_capture_session():
+    """Return the shared capture session, creating it on first use."""
+    global _default_session
+    if _default_session is None:
+        with _session_lock:
+            if _default_session is None:
+                _default_session = CaptureSession()
+    return _default_session
+
+def close_capture_session():
+    """Close the shared capture session. A new one is created on the next screenshot()."""
+    global _default_session
+    with _session_lock:
+        session, _default_session = _default_session, None
+    if session is not None:
+        session.close()
+
+def screenshot(x1=None, y1=None, x2=None, y2=None):
+    if None not in (x1,y1,x2,y2):
+        region = {"left":x1,"top":y1,"width":x2-x1,"height":y2-y1}
+    else:
+        region = None
+    return get_capture_session().grab(region)
@@ -0,0 +1,215 @@
+import threading
+import time
+import numpy as np
+from .screenshot import get_capture_session, screenshot
+from ..debug import debug_print as _debug_print
+
+class FrameStream:
+    """
+    Background frame producer.
+
+    A single thread grabs frames at a fixed rate into a ring buffer of preallocated
+    arrays. Any number of waiters can read the latest frame or block until a newer
+    one arrives, so concurrent waits share one capture stream.
+
+    Frames are returned as private copies by default. With copy=False they are views
+    into the ring buffer instead: the capture thread overwrites a view's slot
+    buffer_size frames later (buffer_size / fps seconds, 0.2 s at the defaults), so
+    only use views for work that finishes well within that, and never keep them.
+
+    Args:
+        fps: Target capture rate
+        buffer_size: Number of preallocated frames in the ring buffer
+        region: Optional dict with left/top/width/height (defaults to the primary monitor)
+        session: Optional CaptureSession (defaults to the shared session)
+    """
+    def __init__(self, fps=20, buffer_size=4, region=None, session=None):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if buffer_size < 2:
+            raise ValueError("buffer_size must be at least 2")
+        self.fps = fps
+        self.session = session if session is not None else get_capture_session()
+        self.region = dict(region) if region is not None else self.session.monitor_region()
+        shape = (self.region['height'], self.region['width'], 3)
+        self._frames = [np.empty(shape, dtype=np.uint8) for _ in range(buffer_size)]
+        self._times = [0.0] * buffer_size
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def seq(self):
+        """Sequence number of the latest frame (0 before the first frame)."""
+        return self._seq
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PyAutomateFrameStream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        try:
+            self._capture_loop()
+        finally:
+            # Don't keep this thread's capture handle until the thread object is collected
+            self.session.release_thread()
+
+    def _capture_loop(self):
+        interval = 1.0 / self.fps
+        next_time = time.perf_counter()
+        while not self._stop.is_set():
+            slot = (self._seq + 1) % len(self._frames)
+            try:
+                self.session.grab(self.region, out=self._frames[slot])
+            except Exception as e:
+                _debug_print(f"Frame stream capture error: {e}")
+                self._stop.wait(interval)
+                continue
+            with self._cond:
+                self._times[slot] = time.perf_counter()
+                self._seq += 1
+                self._cond.notify_all()
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                # Capture is slower than the target rate, don't try to catch up
+                next_time = time.perf_counter()
+
+    def _frame(self, seq, copy):
+        slot = seq % len(self._frames)
+        img = self._frames[slot]
+        return (img.copy() if copy else img), self._times[slot]
+
+    def latest(self, copy=True):
+        """
+        Return the latest frame without waiting (a ring-buffer view if copy=False).
+
+        Returns:
+            (img, region, seq) or (None, region, 0) if no frame was captured yet
+        """
+        with self._cond:
+            seq = self._seq
+            if seq == 0:
+                return None, self.region, 0
+            img, _ = self._frame(seq, copy)
+        return img, self.region, seq
+
+    def wait_newer(self, after_seq=0, timeout=None, copy=True):
+        """
+        Block until a frame newer than `after_seq` is available (a ring-buffer view if copy=False).
+
+        Returns:
+            (img, region, seq), or (None, region, after_seq) on timeout or when the stream stops
+        """
+        with self._cond:
+            ready = self._cond.wait_for(lambda: self._seq > after_seq or self._stop.is_set(), timeout)
+            if not ready or self._seq <= after_seq:
+                return None, self.region, after_seq
+            seq = self._seq
+            img, _ = self._frame(seq, copy)
+        return img, self.region, seq
+
+    def frame_time(self, seq):
+        """Return the perf_counter timestamp of frame `seq` while it is still in the buffer."""
+        with self._cond:
+            if seq <= 0 or self._seq - seq >= len(self._frames):
+                return None
+            return self._times[seq % len(self._frames)]
+
+_stream = None
+_stream_lock = threading.Lock()
+
+def start_frame_stream(fps=20, buffer_size=4, region=None):
+    """
+    Start the shared background frame stream used by the waiting functions.
+    Restarts it if it is already running.
+    """
+    global _stream
+    with _stream_lock:
+        if _stream is not None:
+            _stream.stop()
+        _stream = FrameStream(fps, buffer_size, region).start()
+    return _stream
+
+def stop_frame_stream():
+    """Stop the shared background frame stream. Waiters go back to taking their own screenshots."""
+    global _stream
+    with _stream_lock:
+        stream, _stream = _stream, None
+    if stream is not None:
+        stream.stop()
+
+def get_frame_stream():
+    """Return the running shared frame stream, or None."""
+    stream = _stream
+    if stream is not None and stream.is_running():
+        return stream
+    return None
+
+def _crop(img, stream_region, region):
+    x1 = region['left'] - stream_region['left']
+    y1 = region['top'] - stream_region['top']
+    x2 = x1 + region['width']
+    y2 = y1 + region['height']
+    if x1 < 0 or y1 < 0 or x2 > img.shape[1] or y2 > img.shape[0]:
+        return None
+    return img[y1:y2, x1:x2]
+
+def next_frame(after_seq=None, region=None, timeout=1.0, copy=True):
+    """
+    Return the next frame for a polling loop.
+
+    Reads from the shared frame stream when it is running (blocking until a frame
+    newer than `after_seq` arrives), otherwise takes a screenshot.
+
+    Args:
+        after_seq: Sequence number returned by the previous call (None for the first call)
+        region: Optional dict with left/top/width/height to restrict the frame to
+        timeout: Seconds to wait for a newer stream frame before falling back to a screenshot
+        copy: Return a private copy; False returns a view into the stream's ring buffer,
+            valid only until the capture thread wraps around (see FrameStream)
+
+    Returns:
+        (img, region, seq). seq is None when the frame came from screenshot().
+    """
+    stream = get_frame_stream()
+    if stream is not None:
+        if after_seq is None:
+            img, stream_region, seq = stream.latest(copy=False)
+            if img is None:
+                img, stream_region, seq = stream.wait_newer(0, timeout, copy=False)
+        else:
+            img, stream_region, seq = stream.wait_newer(after_seq, timeout, copy=False)
+        if img is not None:
+            if region is None:
+                return (img.copy() if copy else img), stream_region, seq
+            crop = _crop(img, stream_region, region)
+            if crop is not None:
+                return (crop.copy() if copy else crop), dict(region), seq
+
+    if region is not None:
+        img, region = screenshot(region['left'], region['top'],
+                                 region['left'] + region['width'], region['top'] + region['height'])
+    else:
+        img, region = screenshot()
+    return img, region, None
+
+__all__ = ['FrameStream', 'start_frame_stream', 'stop_frame_stream', 'get_frame_stream', 'next_frame']
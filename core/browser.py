@@ -1,3 +1,5 @@
+import os
+import threading
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -7,14 +9,101 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    WebDriverException,
 )
+from collections import OrderedDict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from ..debug import debug_print as _debug_print
 
 
 _all_drivers = []
 _default_driver = None  # Initialize the default driver variable
+_drivers_lock = threading.RLock()
+_thread_local = threading.local()  # Per-thread default driver (see set_thread_driver)
 
-def init_driver(browser_name="chrome", headless=False, window_size=(1920,1080)):
-    global _default_driver
+class DriverProfile:
+    """
+    Named page-load configuration for init_driver.
+
+    Args:
+        name: Profile name
+        page_load_strategy: "normal" (wait for the load event), "eager" (DOMContentLoaded)
+                            or "none" (return as soon as navigation starts)
+        block_urls: URL patterns ('*' wildcards) blocked through CDP Network.setBlockedURLs
+        disable_images: Don't load images
+        user_data_dir: Chrome profile directory kept between runs (logins, caches)
+        arguments: Extra Chrome command-line arguments
+    """
+    __slots__ = ('name', 'page_load_strategy', 'block_urls', 'disable_images', 'user_data_dir', 'arguments')
+
+    def __init__(self, name, page_load_strategy="normal", block_urls=(), disable_images=False, user_data_dir=None,
+                 arguments=()):
+        if page_load_strategy not in ("normal", "eager", "none"):
+            raise ValueError(f"Invalid page_load_strategy: {page_load_strategy!r}")
+        self.name = name
+        self.page_load_strategy = page_load_strategy
+        self.block_urls = tuple(block_urls)
+        self.disable_images = disable_images
+        self.user_data_dir = user_data_dir
+        self.arguments = tuple(arguments)
+
+    def __repr__(self):
+        return (f"DriverProfile({self.name!r}, page_load_strategy={self.page_load_strategy!r}, "
+                f"block_urls={len(self.block_urls)} patterns, disable_images={self.disable_images})")
+
+# Resources scrapers never look at
+_HEAVY_URLS = (
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+)
+
+_driver_profiles = {
+    # Plain Chrome, as init_driver behaved before profiles
+    "default": DriverProfile("default"),
+    # Returns at DOMContentLoaded, without images, fonts, media or analytics
+    "fast": DriverProfile("fast", "eager", _HEAVY_URLS, disable_images=True),
+    # Returns as soon as navigation starts; callers wait for the elements they need
+    "minimal": DriverProfile("minimal", "none", _HEAVY_URLS, disable_images=True),
+}
+_driver_profile_names = {}  # driver -> name of the profile it was started with
+_visited_origins = {}       # driver -> set of http(s) origins opened with goto()
+_load_timings = {}          # profile name -> [count, total, min, max] seconds
+_timings_lock = threading.Lock()
+
+def register_driver_profile(name, **settings):
+    """
+    Add or replace a named init_driver profile.
+
+    Args:
+        name: Profile name
+        **settings: DriverProfile arguments (page_load_strategy, block_urls,
+                    disable_images, user_data_dir, arguments)
+
+    Returns:
+        The new DriverProfile
+    """
+    profile = DriverProfile(name, **settings)
+    _driver_profiles[name] = profile
+    return profile
+
+def get_driver_profile(profile=None):
+    """Resolve a profile name or DriverProfile (None = "default")."""
+    if isinstance(profile, DriverProfile):
+        return profile
+    name = profile or "default"
+    if name not in _driver_profiles:
+        raise ValueError(f"Unknown driver profile: {name!r} (available: {', '.join(_driver_profiles)})")
+    return _driver_profiles[name]
+
+def _launch_driver(browser_name="chrome", headless=False, window_size=(1920,1080), profile=None,
+                   user_data_dir=None):
+    """Start a browser without registering it."""
+    profile = get_driver_profile(profile)
     if browser_name.lower() == "chrome":
         chrome_options = webdriver.ChromeOptions()
         chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
@@ -23,34 +112,157 @@ def init_driver(browser_name="chrome", headless=False, window_size=(1920,1080)):
         # chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
         if headless:
             chrome_options.add_argument("--headless")
+        chrome_options.page_load_strategy = profile.page_load_strategy
+        if profile.disable_images:
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        user_data_dir = user_data_dir or profile.user_data_dir
+        if user_data_dir:
+            user_data_dir = os.path.abspath(user_data_dir)
+            os.makedirs(user_data_dir, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+        for argument in profile.arguments:
+            chrome_options.add_argument(argument)
         driver = webdriver.Chrome(options=chrome_options)
-    else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
-    _all_drivers.append(driver)
-    if _default_driver is None:
-        _default_driver = driver
+        if profile.block_urls:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.block_urls)})
+            except WebDriverException as e:
+                print(f"[DRIVER-WARN] URL blocking not available: {type(e).__name__}: {e}")
+        with _drivers_lock:
+            _driver_profile_names[driver] = profile.name
+        return driver
+    raise ValueError(f"Unsupported browser: {browser_name}")
+
+def _register_driver(driver, make_default=True):
+    """Track a driver for close_all_drivers, optionally making it the process default."""
+    global _default_driver
+    with _drivers_lock:
+        _all_drivers.append(driver)
+        if make_default and _default_driver is None:
+            _default_driver = driver
     return driver
 
+def init_driver(browser_name="chrome", headless=False, window_size=(1920,1080), profile=None, user_data_dir=None):
+    """
+    Start a browser and register it (the first one becomes the default driver).
+
+    Args:
+        browser_name: Only "chrome" is supported
+        headless: Run without a window
+        window_size: (width, height)
+        profile: DriverProfile or profile name ("default", "fast", "minimal" or registered)
+        user_data_dir: Persistent Chrome profile directory (overrides the profile's)
+    """
+    driver = _launch_driver(browser_name, headless, window_size, profile, user_data_dir)
+    return _register_driver(driver)
+
+def record_load_time(driver, seconds):
+    """Add one driver.get() duration to the timings of the driver's profile (see get_load_timings)."""
+    name = _driver_profile_names.get(driver, "default")
+    with _timings_lock:
+        stats = _load_timings.get(name)
+        if stats is None:
+            _load_timings[name] = [1, seconds, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = min(stats[2], seconds)
+            stats[3] = max(stats[3], seconds)
+
+def get_load_timings():
+    """
+    Page load timings recorded by goto(), per driver profile.
+
+    Only driver.get() is timed, so what a timing covers depends on the profile's
+    page_load_strategy: the load event for "normal", DOMContentLoaded for "eager",
+    and just the start of navigation for "none" (e.g. "minimal"). With "none" the
+    page is still loading when the timing ends; the rest of the wait is spent in
+    the next wait_for_element() or read(). Compare profiles by end-to-end workflow
+    time, not by these numbers alone.
+
+    Returns:
+        {profile name: {'count', 'total', 'mean', 'min', 'max'}} in seconds
+    """
+    with _timings_lock:
+        return {name: {'count': count, 'total': total, 'mean': total / count, 'min': low, 'max': high}
+                for name, (count, total, low, high) in _load_timings.items()}
+
+def reset_load_timings():
+    with _timings_lock:
+        _load_timings.clear()
+
+def _url_origin(url):
+    """scheme://host[:port] of an http(s) URL, or None for other URLs."""
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
+def _note_origin(driver, url):
+    """Remember the origin of a URL opened in `driver` (see _take_origins)."""
+    origin = _url_origin(url)
+    if origin is not None:
+        with _drivers_lock:
+            _visited_origins.setdefault(driver, set()).add(origin)
+
+def _take_origins(driver):
+    """Return and forget the origins noted for `driver` (used to clear their storage)."""
+    with _drivers_lock:
+        return _visited_origins.pop(driver, set())
+
 def get_driver():
-    return _default_driver
+    """Return the calling thread's driver if one is set, otherwise the process default driver."""
+    driver = getattr(_thread_local, "driver", None)
+    return driver if driver is not None else _default_driver
+
+def set_thread_driver(driver):
+    """
+    Make `driver` the default driver of the calling thread (None to go back to the
+    process default). Returns the previous thread driver.
+    """
+    previous = getattr(_thread_local, "driver", None)
+    _thread_local.driver = driver
+    return previous
 
 def close_driver(driver):
+    global _default_driver
     try:
         driver.quit()
-        _all_drivers.remove(driver)
-        if driver == _default_driver:
-            _default_driver = None
     except:
         return False
+    finally:
+        with _snapshot_lock:
+            _snapshots.pop(driver, None)
+        _element_cache.invalidate(driver)
+        with _drivers_lock:
+            _driver_profile_names.pop(driver, None)
+            _visited_origins.pop(driver, None)
+            if driver in _all_drivers:
+                _all_drivers.remove(driver)
+            if driver is _default_driver:
+                _default_driver = None
+        if getattr(_thread_local, "driver", None) is driver:
+            _thread_local.driver = None
     return True
 
 def close_all_drivers():
-    for d in _all_drivers:
+    global _default_driver
+    with _drivers_lock:
+        drivers = list(_all_drivers)
+        _all_drivers.clear()
+        _driver_profile_names.clear()
+        _visited_origins.clear()
+        _default_driver = None
+    with _snapshot_lock:
+        _snapshots.clear()
+    _element_cache.invalidate()
+    _thread_local.driver = None
+    ok = True
+    for d in drivers:
         try:
             d.quit()
         except:
-            return False
-    return True
+            ok = False
+    return ok
 
 def get_selector_type(selector_type):
     if selector_type == "xpath":
@@ -171,17 +383,175 @@ def select_by_value(selector_type, selector, value, driver=None, timeout=10):
         driver = get_driver()
     if driver is None:
         raise ValueError("Driver is not initialized")
-    element = wait_for_element(driver, "interactable", selector_type, selector, timeout)
+    element, _ = with_element(driver, selector_type, selector, lambda el: Select(el).select_by_value(value), timeout)
     if element:
-        select = Select(element)
-        select.select_by_value(value)
         return True
     else:
         print(f"No visible select element found for: {selector}")
         return False
 
 
+# Defines text(el): an element's visible text normalized like Selenium's element.text
+# (lines trimmed, blank lines dropped, non-breaking spaces turned into spaces, hidden
+# elements empty). Prepended to scripts that read texts in bulk.
+_TEXT_JS = r"""
+function text(el) {
+    if (!el.getClientRects().length) return '';
+    var style = getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse' || style.opacity === '0') return '';
+    return el.innerText.split('\n').map(function (line) {
+        return line.replace(/^[^\S\xa0]+|[^\S\xa0]+$/g, '');
+    }).filter(function (line) { return line.length; }).join('\n').replace(/\xa0/g, ' ');
+}
+"""
+
+# Serializes table rows in the page: per row the texts of its <td> cells (or <th> cells
+# if it has no <td>), plus the <th> texts of the first row. Unrendered cells read as ''
+# like WebElement.text does.
+_TABLE_SCRIPT = """
+var rows = arguments[0];
+function cellTexts(cells) {
+    return Array.prototype.map.call(cells, text);
+}
+var data = [];
+for (var i = 0; i < rows.length; i++) {
+    var cells = rows[i].getElementsByTagName('td');
+    if (!cells.length) cells = rows[i].getElementsByTagName('th');
+    if (cells.length) data.push(cellTexts(cells));
+}
+var headers = rows.length ? cellTexts(rows[0].getElementsByTagName('th')) : [];
+return [data, headers];
+"""
+
+def _read_table(driver, rows):
+    """
+    Read the cell texts of table rows.
+
+    Returns:
+        (data, headers): list of cell-text lists for rows that have cells, and the
+        <th> texts of the first row (empty if it has none).
+    """
+    try:
+        data, headers = driver.execute_script(_TEXT_JS + _TABLE_SCRIPT, rows)
+        return [[t.strip() for t in row] for row in data], [t.strip() for t in headers]
+    except WebDriverException as e:
+        print(f"[READ-WARN] Table script failed, reading cells one by one: {type(e).__name__}")
+    data = []
+    for row in rows:
+        cells = row.find_elements(By.TAG_NAME, "td") or row.find_elements(By.TAG_NAME, "th")
+        texts = [c.text.strip() for c in cells]
+        if texts:
+            data.append(texts)
+    headers = [c.text.strip() for c in rows[0].find_elements(By.TAG_NAME, "th")] if rows else []
+    return data, headers
+
+# Defines find(by, locator): the elements matching a Selenium locator, queried in the page.
+# Prepended to scripts that need to re-run a query without a WebDriver round trip.
+_FIND_JS = r"""
+function find(by, locator) {
+    var list;
+    if (by === 'xpath') {
+        var snap = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        list = [];
+        for (var i = 0; i < snap.snapshotLength; i++) {
+            if (snap.snapshotItem(i).nodeType === 1) list.push(snap.snapshotItem(i));
+        }
+        return list;
+    }
+    if (by === 'css selector') list = document.querySelectorAll(locator);
+    else if (by === 'id') list = document.querySelectorAll('[id="' + locator.replace(/(["\\])/g, '\\$1') + '"]');
+    else if (by === 'class name') list = document.getElementsByClassName(locator);
+    else if (by === 'tag name') list = document.getElementsByTagName(locator);
+    else if (by === 'name') list = document.getElementsByName(locator);
+    else throw new Error('Unsupported locator strategy: ' + by);
+    return Array.prototype.slice.call(list);
+}
+"""
+
+# Resolves with the matches once neither their count nor anything under their common
+# ancestor has changed for quietMs, or with null after timeoutMs.
+_STABLE_JS = """
+var by = arguments[0], locator = arguments[1], quietMs = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+// null without matches: then only a change in the match count restarts the quiet timer
+function commonAncestor(els) {
+    if (!els.length) return null;
+    var node = els[0].parentNode || document.documentElement;
+    for (var i = 1; i < els.length; i++) {
+        while (!node.contains(els[i])) node = node.parentNode;
+    }
+    return node;
+}
+var matches = find(by, locator), root = commonAncestor(matches), timer, deadline;
+var observer = new MutationObserver(function (records) {
+    var current = find(by, locator), changed = current.length !== matches.length;
+    for (var i = 0; !changed && root && i < records.length; i++) changed = root.contains(records[i].target);
+    if (!changed) return;
+    matches = current;
+    root = commonAncestor(current);
+    clearTimeout(timer);
+    timer = setTimeout(quiet, quietMs);
+});
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    done(result);
+}
+function quiet() { finish(find(by, locator)); }
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+timer = setTimeout(quiet, quietMs);
+deadline = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+# WebDriver's default script timeout, restored when the current one can't be read
+_DEFAULT_SCRIPT_TIMEOUT = 30
+
+@contextmanager
+def _script_timeout(driver, seconds):
+    """
+    Raise the driver's async script timeout to at least `seconds` for a `with` block,
+    then restore the caller's timeout.
+    """
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = None
+    if previous is not None and previous >= seconds:
+        yield
+        return
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        try:
+            driver.set_script_timeout(_DEFAULT_SCRIPT_TIMEOUT if previous is None else previous)
+        except WebDriverException as e:
+            _debug_print(f"Could not restore the script timeout: {type(e).__name__}")
+
 def wait_for_stable_elements(driver, by, locator, stable_time=2.0, timeout=30):
+    """
+    Wait until the elements matching the locator have stopped changing for
+    `stable_time` seconds (or timeout).
+
+    A MutationObserver installed in the page watches the match count and the subtree
+    under the matches, so the wait returns as soon as the list has been quiet for
+    `stable_time`, in a single execute_async_script call. Falls back to polling
+    `find_elements` counts if the script can't run.
+    """
+    start = time.time()
+    try:
+        with _script_timeout(driver, timeout + 5):
+            elements = driver.execute_async_script(_FIND_JS + _STABLE_JS, by, locator,
+                                                   int(stable_time * 1000), int(timeout * 1000))
+    except WebDriverException as e:
+        print(f"[WAIT-WARN] Stability observer failed, polling instead: {type(e).__name__}")
+        return _poll_stable_elements(driver, by, locator, stable_time, max(0.0, timeout - (time.time() - start)))
+    if elements is None:
+        raise TimeoutException(f"Elements for {locator!r} never stabilized in {timeout}s")
+    return elements
+
+def _poll_stable_elements(driver, by, locator, stable_time=2.0, timeout=30):
     """
     Poll `find_elements` until the number of matching elements
     stays constant for `stable_time` seconds (or timeout).
@@ -204,6 +574,98 @@ def wait_for_stable_elements(driver, by, locator, stable_time=2.0, timeout=30):
 
     raise TimeoutException(f"Elements for {locator!r} never stabilized in {timeout}s")
 
+# Resolves with the element(s) meeting a wait condition, checked on every DOM mutation
+# and animation frame (a 50 ms timer while the tab is hidden), or with null after timeoutMs.
+# Conditions mirror the WebDriverWait versions: only "interactable" looks past the first match.
+_WAIT_JS = """
+var by = arguments[0], locator = arguments[1], condition = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+function displayed(el) {
+    if (!el.isConnected) return false;
+    if (el.checkVisibility) {
+        if (!el.checkVisibility({opacityProperty: true, visibilityProperty: true})) return false;
+    } else {
+        var style = getComputedStyle(el);
+        if (style.visibility === 'hidden' || style.visibility === 'collapse' || style.opacity === '0') return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function enabled(el) {
+    return !el.matches(':disabled');
+}
+function check() {
+    var els = find(by, locator);
+    if (condition === 'all_present') return els.length ? els : null;
+    if (condition === 'interactable') {
+        for (var i = 0; i < els.length; i++) {
+            if (displayed(els[i]) && enabled(els[i])) return els[i];
+        }
+        return null;
+    }
+    var el = els[0];
+    if (!el) return null;
+    if (condition === 'present') return el;
+    if (!displayed(el)) return null;
+    if (condition === 'visible') return el;
+    return enabled(el) ? el : null;
+}
+var finished = false, observer, deadline;
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(deadline);
+    done(result);
+}
+function tick() {
+    if (finished) return;
+    var result = check();
+    if (result) finish(result);
+    else if (document.hidden) setTimeout(tick, 50);
+    else requestAnimationFrame(tick);
+}
+tick();
+if (!finished) {
+    observer = new MutationObserver(function () {
+        var result = check();
+        if (result) finish(result);
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    deadline = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+_WAIT_ENGINES = ("webdriver", "page")
+_PAGE_WAIT_TYPES = ("present", "all_present", "visible", "clickable", "inputable", "interactable")
+_wait_engine = "webdriver"
+
+def set_wait_engine(engine):
+    """
+    Choose how wait_for_element evaluates its conditions by default.
+
+    Args:
+        engine: "webdriver" to poll with WebDriverWait from Python, or "page" to
+                evaluate presence, visibility, clickability and interactability inside
+                the page, resolving on the first DOM mutation or frame where they hold
+    """
+    global _wait_engine
+    if engine not in _WAIT_ENGINES:
+        raise ValueError(f"Invalid wait engine: {engine!r}. Use 'webdriver' or 'page'.")
+    _wait_engine = engine
+
+def _page_wait(driver, by, locator, condition, timeout):
+    """Evaluate a wait condition inside the page with one execute_async_script call."""
+    with _script_timeout(driver, timeout + 5):
+        result = driver.execute_async_script(_FIND_JS + _WAIT_JS, by, locator, condition, int(timeout * 1000))
+    if not result:
+        raise TimeoutException(f"{condition!r} not met in {timeout}s")
+    return result
+
+def _normalize_by(by):
+    """Accept the selector_type names that aren't also Selenium By values ("css", "class")."""
+    return get_selector_type(by) if by in ("css", "class") else by
+
 def wait_for_element(
     driver,
     wait_type,     # e.g. "visible", "interactable", "stable_list", etc.
@@ -211,8 +673,13 @@ def wait_for_element(
     locator,       # the selector string
     timeout=20,
     expected_count=None,  # only used for "all_exact"
-    stable_time=2.0       # only used for "stable_list"
+    stable_time=2.0,      # only used for "stable_list"
+    engine=None           # "webdriver" or "page" (default: set_wait_engine)
 ):
+    engine = engine or _wait_engine
+    if engine not in _WAIT_ENGINES:
+        raise ValueError(f"Invalid wait engine: {engine!r}. Use 'webdriver' or 'page'.")
+    by = _normalize_by(by)
     wait = WebDriverWait(driver, timeout)
 
     def _first_interactable(d):
@@ -242,12 +709,150 @@ def wait_for_element(
     try:
         if wait_type not in wait_map:
             raise ValueError(f"Invalid wait_type: {wait_type!r}")
+        if engine == "page" and wait_type in _PAGE_WAIT_TYPES:
+            start = time.time()
+            try:
+                return _page_wait(driver, by, locator, wait_type, timeout)
+            except TimeoutException:
+                raise
+            except WebDriverException as e:
+                print(f"[WAIT-WARN] In-page wait failed, polling instead: {type(e).__name__}")
+                wait = WebDriverWait(driver, max(0.0, timeout - (time.time() - start)))
         return wait_map[wait_type]()
     except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as e:
         print(f"[WAIT-ERROR] '{wait_type}' failed after {timeout}s on {locator!r}")
         print(f"   {type(e).__name__}: {e}")
         return None
 
+class ElementCache:
+    """
+    Resolved elements per driver, keyed by (by, selector), with hit/miss counters.
+
+    Args:
+        maxsize: Maximum number of cached elements over all drivers
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.recovered = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, driver, by, selector):
+        """Return the cached element, or None."""
+        with self._lock:
+            element = self._entries.get((driver, by, selector))
+            if element is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((driver, by, selector))
+            self.hits += 1
+            return element
+
+    def put(self, driver, by, selector, element):
+        with self._lock:
+            self._entries[(driver, by, selector)] = element
+            self._entries.move_to_end((driver, by, selector))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def drop_failed(self, driver, by, selector):
+        """Drop an element that failed when used; it will be resolved again."""
+        with self._lock:
+            self._entries.pop((driver, by, selector), None)
+            self.recovered += 1
+
+    def invalidate(self, driver=None, by=None, selector=None):
+        """Drop one entry, every entry of a driver, or everything (no arguments)."""
+        with self._lock:
+            if driver is None:
+                self._entries.clear()
+            elif selector is not None:
+                self._entries.pop((driver, by, selector), None)
+            else:
+                for key in [k for k in self._entries if k[0] is driver]:
+                    del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'recovered': self.recovered,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+_element_cache = ElementCache()
+
+def get_element_cache():
+    """Return the element cache used by the selector-based actions."""
+    return _element_cache
+
+def set_element_cache(enabled=True):
+    """Enable or disable element caching for the selector-based actions."""
+    _element_cache.enabled = enabled
+    if not enabled:
+        _element_cache.invalidate()
+
+def invalidate_elements(driver=None):
+    """Forget cached elements of a driver (all drivers if None), e.g. after navigation."""
+    _element_cache.invalidate(driver)
+
+# Failures of a cached element that resolving it again can fix
+_RECOVERABLE = (StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException)
+
+# True if the cached element (arguments[2]) is still attached, still matched by the
+# locator, displayed and enabled: the conditions of wait_for_element(..., "interactable").
+_CACHED_CHECK_JS = """
+var el = arguments[2];
+if (!el || !el.isConnected || find(arguments[0], arguments[1]).indexOf(el) < 0) return false;
+if (el.matches(':disabled')) return false;
+var style = getComputedStyle(el);
+return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.visibility !== 'collapse'
+    && style.opacity !== '0';
+"""
+
+def _cached_element_usable(driver, by, selector, element):
+    try:
+        return bool(driver.execute_script(_FIND_JS + _CACHED_CHECK_JS, by, selector, element))
+    except WebDriverException:
+        return False
+
+def with_element(driver, by, selector, action, timeout=10):
+    """
+    Run `action(element)` on the first interactable element for the selector.
+
+    The element comes from the element cache when possible. A cached element is only
+    used if one script call confirms it still matches the selector and is displayed
+    and enabled; otherwise, or if the action still fails because the element went
+    stale or is covered, it is resolved again with wait_for_element(..., "interactable").
+
+    Returns:
+        (element, result of action), or (None, None) if no interactable element was found.
+    """
+    by = _normalize_by(by)
+    cache = _element_cache
+    element = cache.get(driver, by, selector) if cache.enabled else None
+    if element is not None and not _cached_element_usable(driver, by, selector, element):
+        _debug_print(f"Cached element for {selector!r} no longer matches or is not interactable, resolving it again")
+        cache.drop_failed(driver, by, selector)
+        element = None
+    if element is not None:
+        try:
+            return element, action(element)
+        except _RECOVERABLE as e:
+            _debug_print(f"Cached element for {selector!r} failed ({type(e).__name__}), resolving it again")
+            cache.drop_failed(driver, by, selector)
+        finally:
+            _drop_snapshot(driver)
+    element = wait_for_element(driver, "interactable", by, selector, timeout)
+    if not element:
+        return None, None
+    if cache.enabled:
+        cache.put(driver, by, selector, element)
+    try:
+        return element, action(element)
+    finally:
+        _drop_snapshot(driver)
+
 def wait_element_hidden(selector_type, selector, driver=None, timeout=20):
     if driver is None:
         driver = get_driver()
@@ -256,13 +861,90 @@ def wait_element_hidden(selector_type, selector, driver=None, timeout=20):
     wait = WebDriverWait(driver, timeout)
     return wait.until(EC.invisibility_of_element_located((get_selector_type(selector_type), selector)))
 
+# Keeps a per-document token and a version counter bumped by every DOM mutation and by
+# resizes and finished transitions/animations (innerText depends on layout). Returns
+# [token, version, entries]: entries is null when the caller's [token, version] is still
+# current, otherwise one row per match with the values read() reports.
+# Not observed: form field values (a property, not the DOM; "value" is always read live),
+# stylesheet rule changes made through the CSSOM, and :hover/:focus styles. Actions run
+# through with_element() drop the driver's snapshot, covering this library's own input.
+_SNAPSHOT_JS = """
+var by = arguments[0], locator = arguments[1], known = arguments[2];
+var state = window.__pyautomateSnapshot;
+if (!state) {
+    state = window.__pyautomateSnapshot = {token: Date.now().toString(36) + Math.random().toString(36).slice(2), version: 0};
+    var bump = function () { state.version++; };
+    new MutationObserver(bump)
+        .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    ['resize', 'transitionend', 'animationend'].forEach(function (type) { window.addEventListener(type, bump, true); });
+}
+if (known && known[0] === state.token && known[1] === state.version) return [state.token, state.version, null];
+var entries = find(by, locator).map(function (el) {
+    return [text(el), el.innerHTML, el.outerHTML, el.tagName.toLowerCase(),
+            el.getAttribute('class'), el.getAttribute('id')];
+});
+return [state.token, state.version, entries];
+"""
+
+_SNAPSHOT_TYPES = ("text", "html", "inner_html", "outer_html", "attribute")
+_snapshots = {}  # driver -> [token, version, {(by, selector): entries}]
+_snapshot_lock = threading.Lock()
+_snapshot_stats = {'hits': 0, 'misses': 0}
+
+def _snapshot_read(driver, by, selector):
+    """
+    Serialized values of every element matching the selector, reused while the page
+    has not mutated since they were read.
+    """
+    key = (by, selector)
+    for _ in range(2):
+        with _snapshot_lock:
+            state = _snapshots.get(driver)
+            known = [state[0], state[1]] if state is not None and key in state[2] else None
+        token, version, entries = driver.execute_script(_FIND_JS + _TEXT_JS + _SNAPSHOT_JS, by, selector, known)
+        with _snapshot_lock:
+            state = _snapshots.get(driver)
+            if entries is None:
+                if state is not None and state[0] == token and state[1] == version and key in state[2]:
+                    _snapshot_stats['hits'] += 1
+                    return state[2][key]
+                # The cached entry was dropped meanwhile (e.g. by another thread): read again
+                continue
+            _snapshot_stats['misses'] += 1
+            if state is None or state[0] != token or state[1] != version:
+                state = _snapshots[driver] = [token, version, {}]
+            state[2][key] = entries
+            return entries
+    return []
+
+def _drop_snapshot(driver):
+    """Forget a driver's snapshot so the next snapshot read queries the page again."""
+    with _snapshot_lock:
+        _snapshots.pop(driver, None)
+
+def get_snapshot_stats():
+    """Hit/miss counters of snapshot reads (read(..., snapshot=True))."""
+    with _snapshot_lock:
+        return dict(_snapshot_stats, drivers=len(_snapshots))
+
+def _snapshot_value(entries, content_type):
+    """Shape serialized snapshot entries like the element-based read() results."""
+    if content_type == "attribute":
+        values = [{"text": text, "innerHTML": inner, "outerHTML": outer, "tag_name": tag, "class": cls, "id": id_}
+                  for text, inner, outer, tag, cls, id_ in entries]
+    else:
+        column = {"text": 0, "html": 1, "inner_html": 1, "outer_html": 2}[content_type]
+        values = [entry[column] for entry in entries]
+    return values[0] if len(values) == 1 else values
+
 def read(
     selector_type,      # "xpath", "css", "id", "class", etc.
     selector,
     content_type="text",
     driver=None,
     timeout=20,
-    stable_time=1.0     # how long table rows must be stable
+    stable_time=1.0,    # how long table rows must be stable
+    snapshot=False      # answer non-table reads from an in-page snapshot, reused until the page mutates
 ):
     if driver is None:
         driver = get_driver()
@@ -288,21 +970,15 @@ def read(
         if content_type == "table_rows":
             return rows
 
-        # build list-of-lists
-        data = []
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td") or row.find_elements(By.TAG_NAME, "th")
-            texts = [c.text.strip() for c in cells]
-            if texts:
-                data.append(texts)
+        # build list-of-lists (and the first row's <th> headers) in one script call
+        data, headers = _read_table(driver, rows)
 
         if content_type == "table_data":
             return data
 
         # table_dict
         # first row headers if any <th>
-        if rows and rows[0].find_elements(By.TAG_NAME, "th"):
-            headers = [c.text.strip() for c in rows[0].find_elements(By.TAG_NAME, "th")]
+        if headers:
             data_rows = data[1:]
         else:
             headers = [f"Column_{i+1}" for i in range(len(data[0]) if data else 0)]
@@ -317,6 +993,20 @@ def read(
                 dicts.append({f"Column_{i+1}": v for i, v in enumerate(row_vals)})
         return dicts
 
+    # —— SNAPSHOT READS ——
+    if snapshot and content_type in _SNAPSHOT_TYPES:
+        try:
+            entries = _snapshot_read(driver, by, selector)
+            if not entries and wait_for_element(driver, "all_present", by, selector, timeout=timeout):
+                entries = _snapshot_read(driver, by, selector)
+        except WebDriverException as e:
+            print(f"[READ-WARN] Snapshot read failed, reading elements: {type(e).__name__}")
+        else:
+            if not entries:
+                print(f"No elements found for selector: {selector}")
+                return []
+            return _snapshot_value(entries, content_type)
+
     # —— GENERIC ELEMENT HANDLING ——  
     elements = wait_for_element(driver, "all_present", by, selector, timeout=timeout) or []
     if not elements:
@@ -0,0 +1,238 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from . import browser
+from ..debug import debug_print as _debug_print
+
+class DriverPool:
+    """
+    Thread-safe pool of pre-launched WebDrivers.
+
+    Browsers are started ahead of time and handed out one lease at a time. A released
+    browser gets its extra windows closed and its cookies and web storage cleared
+    before the next lease (through the Chrome DevTools Protocol, so every domain visited
+    during the lease is covered; browsers without it are recycled instead). After `max_uses` leases it is quit and replaced in the
+    background, so long-lived pools don't accumulate browser state or leaks.
+
+    Args:
+        size: Number of browsers kept in the pool
+        max_uses: Leases after which a browser is recycled (None = never)
+        browser_name, headless, window_size, profile: Passed to init_driver for each browser
+        prelaunch: Start all browsers now (in parallel) instead of on first demand
+
+    Raises:
+        ValueError: If the profile has a user_data_dir (Chrome can't run several browsers on one)
+    """
+    def __init__(self, size=2, max_uses=50, browser_name="chrome", headless=False, window_size=(1920,1080),
+                 profile=None, prelaunch=True):
+        if browser.get_driver_profile(profile).user_data_dir:
+            raise ValueError("Driver profiles with a user_data_dir can't be pooled: Chrome locks the directory "
+                             "to one browser. Use a profile without user_data_dir, or init_driver() per directory.")
+        self.size = size
+        self.max_uses = max_uses
+        self._launch_args = (browser_name, headless, window_size, profile)
+        self._idle = deque()
+        self._uses = {}
+        self._leased = set()
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.launched = 0
+        self.recycled = 0
+        if prelaunch:
+            self.start()
+
+    def _launch(self):
+        """Start one browser and add it to the idle queue (launch slot already reserved)."""
+        driver = None
+        try:
+            start = time.perf_counter()
+            driver = browser._register_driver(browser._launch_driver(*self._launch_args), make_default=False)
+            _debug_print(f"Pool browser started in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            print(f"Error starting pooled browser: {e}")
+        with self._cond:
+            self._launching -= 1
+            closed = self._closed
+            if driver is not None and not closed:
+                self._uses[driver] = 0
+                self._idle.append(driver)
+                self.launched += 1
+            self._cond.notify_all()
+        if driver is not None and closed:
+            browser.close_driver(driver)
+            return None
+        return driver
+
+    def _reserve_launches(self, count):
+        with self._cond:
+            if self._closed:
+                return 0
+            missing = self.size - (len(self._idle) + len(self._leased) + self._launching)
+            count = max(0, min(count, missing))
+            self._launching += count
+        return count
+
+    def start(self):
+        """Launch browsers in parallel until the pool is full; returns once they are up."""
+        threads = [threading.Thread(target=self._launch, name="PyAutomateDriverPoolLaunch", daemon=True)
+                   for _ in range(self._reserve_launches(self.size))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def acquire(self, timeout=None):
+        """
+        Lease a browser, waiting up to `timeout` seconds (None = forever) for one to free up.
+
+        Raises:
+            TimeoutError: If no browser became available in time
+            RuntimeError: If the pool is closed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._idle:
+                        driver = self._idle.popleft()
+                        self._leased.add(driver)
+                        self._uses[driver] += 1
+                        return driver
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if len(self._leased) + self._launching < self.size:
+                        # Pool below size (e.g. a launch failed): start a browser on this thread
+                        self._launching += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No pooled driver available within {timeout}s")
+                    self._cond.wait(remaining)
+            if self._launch() is None:
+                raise RuntimeError("Could not start a pooled browser")
+
+    def release(self, driver, discard=False):
+        """
+        Return a leased browser. Its state is reset for the next lease; it is replaced
+        instead when `discard` is set, the reset fails, or it reached `max_uses`.
+        """
+        with self._cond:
+            if driver not in self._leased:
+                return
+            uses = self._uses.get(driver, 0)
+        if not discard and (self.max_uses is None or uses < self.max_uses):
+            discard = not self._reset(driver)
+        with self._cond:
+            self._leased.discard(driver)
+            if not discard and not self._closed:
+                self._idle.append(driver)
+                self._cond.notify_all()
+                return
+            self._uses.pop(driver, None)
+            self.recycled += 1
+        browser.close_driver(driver)
+        if self._reserve_launches(1):
+            threading.Thread(target=self._launch, name="PyAutomateDriverPoolLaunch", daemon=True).start()
+
+    def _reset(self, driver):
+        """
+        Close extra windows and clear cookies, cache and site storage. Returns False if
+        the browser is unusable or can't be reset through CDP.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            _debug_print("Pooled browser has no CDP access, recycling it")
+            return False
+        try:
+            origins = browser._take_origins(driver)
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origin = browser._url_origin(driver.current_url)
+                if origin is not None:
+                    origins.add(origin)
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get("about:blank")
+            # Domains that set cookies were visited too, e.g. through redirects or links
+            for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", []):
+                domain = cookie.get("domain", "").lstrip(".")
+                if domain:
+                    origins.update((f"https://{domain}", f"http://{domain}"))
+            # Cookies and cache of every domain; storage of each origin the lease is known to have opened
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            browser.invalidate_elements(driver)
+            return True
+        except Exception as e:
+            _debug_print(f"Pooled browser reset failed, recycling it: {e}")
+            return False
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        Lease a browser for a `with` block. It is the calling thread's default driver
+        (see get_driver) inside the block, and is recycled if the block raises a
+        WebDriver error.
+        """
+        driver = self.acquire(timeout)
+        previous = browser.set_thread_driver(driver)
+        discard = False
+        try:
+            yield driver
+        except WebDriverException:
+            discard = True
+            raise
+        finally:
+            browser.set_thread_driver(previous)
+            self.release(driver, discard)
+
+    def stats(self):
+        with self._cond:
+            return {'size': self.size, 'idle': len(self._idle), 'leased': len(self._leased),
+                    'launching': self._launching, 'launched': self.launched, 'recycled': self.recycled}
+
+    def close(self):
+        """Quit every idle browser; leased ones are quit when they are released."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for driver in idle:
+            browser.close_driver(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_driver_pool(size=2, **kwargs):
+    """
+    Return the shared driver pool, creating it with the given arguments (see DriverPool)
+    on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = DriverPool(size, **kwargs)
+        return _pool
+
+def close_driver_pool():
+    """Close the shared driver pool, if any."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+__all__ = ['DriverPool', 'get_driver_pool', 'close_driver_pool']
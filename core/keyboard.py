@@ -1,19 +1,18 @@
 from pynput.keyboard import Controller, Key, KeyCode
-from selenium.webdriver.common.keys import Keys
-from ..core.browser import get_driver, get_selector_type, wait_for_element
 import time
 keyboard = Controller()
 
 def confirm_input(driver=None, selector=None, selector_type=None, timeout=10):
     if selector is not None:
+        from selenium.webdriver.common.keys import Keys
+        from ..core.browser import get_driver, get_selector_type, with_element
         selector_type = get_selector_type(selector_type)
         if driver is None:
             driver = get_driver()
         if driver is None:
             raise ValueError("Driver is not initialized")
-        element = wait_for_element(driver, "interactable", selector_type, selector, timeout)
+        element, _ = with_element(driver, selector_type, selector, lambda el: el.send_keys(Keys.ENTER), timeout)
         if element:
-            element.send_keys(Keys.ENTER)
             return True
         else:
             print(f"No input element found for: {selector}")
@@ -21,24 +20,28 @@ def confirm_input(driver=None, selector=None, selector_type=None, timeout=10):
 
 def type(text: str, driver=None, selector=None, selector_type=None, timeout=10):
         if selector is not None:
+            from ..core.browser import get_driver, get_selector_type, with_element
             selector_type = get_selector_type(selector_type)
             if driver is None:
                 driver = get_driver()
             if driver is None:
                 raise ValueError("Driver is not initialized")
-            element = wait_for_element(driver, "interactable", selector_type, selector, timeout)
+
+            def send(element):
+                element.click()
+                time.sleep(0.1)
+                element.clear()
+                time.sleep(0.1)
+                element.send_keys(text)
+                time.sleep(0.1) 
+
+            try:
+                element, _ = with_element(driver, selector_type, selector, send, timeout)
+            except Exception as e:
+                print(f"Error while sending input: {e}")
+                return False
             if element:
-                try:
-                    element.click()
-                    time.sleep(0.1)
-                    element.clear()
-                    time.sleep(0.1)
-                    element.send_keys(text)
-                    time.sleep(0.1) 
-                    return True
-                except Exception as e:
-                    print(f"Error while sending input: {e}")
-                    return False
+                return True
             else:
                 print(f"No input element found for: {selector}")
                 return False    
@@ -65,30 +68,34 @@ def type(text: str, driver=None, selector=None, selector_type=None, timeout=10):
 
 def clear(driver=None, selector=None, selector_type=None, timeout=10):
     if selector is not None:
+        from selenium.webdriver.common.keys import Keys
+        from ..core.browser import get_driver, get_selector_type, with_element
         selector_type = get_selector_type(selector_type)
         if driver is None:
             driver = get_driver()
         if driver is None:
             raise ValueError("Driver is not initialized")
-        element = wait_for_element(driver, "interactable", selector_type, selector, timeout)
-        if element:
-            try:
-                element.click()
-                time.sleep(0.1)
 
-                # First attempt: normal clear()
-                element.clear()
-                time.sleep(0.1)
+        def clear_input(element):
+            element.click()
+            time.sleep(0.1)
 
-                # Fallback: CTRL+A then BACKSPACE
-                element.send_keys(Keys.CONTROL, 'a')
-                time.sleep(0.05)
-                element.send_keys(Keys.BACKSPACE)
+            # First attempt: normal clear()
+            element.clear()
+            time.sleep(0.1)
 
-                return True
-            except Exception as e:
-                print(f"Error while clearing input: {e}")
-                return False
+            # Fallback: CTRL+A then BACKSPACE
+            element.send_keys(Keys.CONTROL, 'a')
+            time.sleep(0.05)
+            element.send_keys(Keys.BACKSPACE)
+
+        try:
+            element, _ = with_element(driver, selector_type, selector, clear_input, timeout)
+        except Exception as e:
+            print(f"Error while clearing input: {e}")
+            return False
+        if element:
+            return True
         else:
             print(f"No input element found to clear for: {selector}")
             return False
@@ -111,14 +118,14 @@ def get_key(k):
 
 def key(input_str: str, driver=None, selector=None, selector_type=None, timeout=10):
     if selector is not None:
+        from ..core.browser import get_driver, get_selector_type, with_element
         selector_type = get_selector_type(selector_type)
         if driver is None:
             driver = get_driver()
         if driver is None:
             raise ValueError("Driver is not initialized")
-        element = wait_for_element(driver, "interactable", selector_type, selector, timeout)
+        element, _ = with_element(driver, selector_type, selector, lambda el: el.send_keys(input_str), timeout)
         if element:
-            element.send_keys(input_str)
             return True
         else:
             print(f"No element found to send key for: {selector}")
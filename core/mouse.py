@@ -3,10 +3,12 @@ import time
 import ctypes
 mouse = MouseController()
 import cv2
-from ..capture.screenshot import screenshot
-from ..capture.ocr import ocr, is_ocr_initialized
+from ..capture.screenshot import screenshot, get_capture_session
+from ..capture.stream import next_frame
+from ..capture.ocr import ocr, ocr_tiles
 from ..vision.template import get_text_center_coords, get_img_center_coords
 from ..vision import is_visual_initialized
+from ..vision.registry import load_template
 from ..debug import debug_print as _debug_print
 
 def send_input_mouse_move(x: int, y: int):
@@ -107,7 +109,55 @@ def move_mouse(x: int, y: int, strategy="smooth"):
         print(f"Error moving mouse: {e}")
         raise
 
-def hover(target, x_offset=0, y_offset=0, timeout=None, strategy="smooth"):
+def _text_search_region(region=None, anchor=None, anchor_radius=300):
+    """
+    Resolve the screen area searched for a text target.
+
+    Args:
+        region: Optional (x1, y1, x2, y2) screen region
+        anchor: Optional (x, y) point or 'img/...' template the text is near
+        anchor_radius: Half size in pixels of the square searched around the anchor
+
+    Returns:
+        (x1, y1, x2, y2), None to search the whole screen, or False if the anchor wasn't found.
+    """
+    if region is not None:
+        return tuple(region)
+    if anchor is None:
+        return None
+    if isinstance(anchor, str):
+        template = load_template(anchor.lstrip('/'))
+        if template is None:
+            print("Failed to load anchor image")
+            return False
+        screen_img, frame_region, _ = next_frame()
+        anchor = get_img_center_coords(template, template.mask, screen_img)
+        if anchor is None:
+            _debug_print("Anchor image not found")
+            return False
+        anchor = (anchor[0] + frame_region['left'], anchor[1] + frame_region['top'])
+    mon = get_capture_session().monitor_region()
+    x, y = anchor
+    return (max(mon['left'], x - anchor_radius), max(mon['top'], y - anchor_radius),
+            min(mon['left'] + mon['width'], x + anchor_radius), min(mon['top'] + mon['height'], y + anchor_radius))
+
+def hover(target, x_offset=0, y_offset=0, timeout=None, strategy="smooth",
+          region=None, anchor=None, anchor_radius=300, tiled=True, ocr_profile=None):
+    """
+    Move the mouse onto a target.
+
+    Args:
+        target: (x, y) coordinates, an 'img/...' template path, or text to find with OCR
+        x_offset: X offset to add to the target coordinates
+        y_offset: Y offset to add to the target coordinates
+        timeout: Optional timeout in seconds for image targets
+        strategy: "smooth" or "real", see move_mouse
+        region: Optional (x1, y1, x2, y2) screen region to search text in
+        anchor: Optional (x, y) point or 'img/...' template; text is searched around it
+        anchor_radius: Half size in pixels of the square searched around the anchor
+        tiled: Use the tile-level OCR cache (see ocr_tiles) for text targets
+        ocr_profile: OCR profile name or OCRProfile for text targets (default: the session profile)
+    """
     _debug_print(f"Hovering on {target}")
     
     # If target is already coordinates, just add offsets
@@ -123,39 +173,35 @@ def hover(target, x_offset=0, y_offset=0, timeout=None, strategy="smooth"):
             
         img_path = target.lstrip('/')
         _debug_print(f"Looking for image {img_path}")
-        img = cv2.imread(img_path, cv2.IMREAD_UNCHANGED)
-        if img is None:
+        template = load_template(img_path)
+        if template is None:
             print("Failed to load image")
             return False
-        bgr   = img[...,:3]
-        alpha = img[..., 3]
-        _, mask = cv2.threshold(alpha, 1, 255, cv2.THRESH_BINARY)
         
-        # Take initial screenshot
-        screen_img, _ = screenshot()
-        coords = get_img_center_coords(bgr, mask, screen_img, x_offset, y_offset, timeout)
+        # Let the matcher take its own frames so every attempt includes the frame's screen offset
+        coords = get_img_center_coords(template, template.mask, None, x_offset, y_offset, timeout)
         if coords:
             _debug_print(f"Found coordinates: {coords}")
             move_mouse(coords[0], coords[1], strategy)
             return True
         return False
 
-    # Otherwise treat as OCR-text
-    if not is_ocr_initialized():
-        print("OCR not initialized. Call initialize_ocr() first.")
-        return False
-        
+    # Otherwise treat as OCR-text (the OCR reader is loaded on first use)
     if not is_visual_initialized():
         print("Visual processing not initialized. Call initialize_visual() first.")
         return False
-        
+
+    search = _text_search_region(region, anchor, anchor_radius)
+    if search is False:
+        return False
     scale_factor = 2
-    img_arr, region = screenshot()
+    img_arr, region = screenshot(*search) if search is not None else screenshot()
     scaled_img = cv2.resize(img_arr, None, fx=scale_factor, fy=scale_factor)
-    ocr_res = ocr(scaled_img, region)
-    coords = get_text_center_coords(ocr_res, target, scale_factor, x_offset, y_offset)
+    ocr_res = (ocr_tiles(scaled_img, region, profile=ocr_profile) if tiled
+               else ocr(scaled_img, region, profile=ocr_profile))
+    coords = get_text_center_coords(ocr_res, target, scale_factor, x_offset, y_offset, region)
     if coords:
         _debug_print(f"Found coordinates: {coords}")
         move_mouse(coords[0], coords[1], strategy)
         return True
-    return False
\ No newline at end of file
+    return False
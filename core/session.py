@@ -0,0 +1,185 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from . import browser
+from .driver_pool import DriverPool, get_driver_pool
+from .keyboard import type as _type, key as _key, clear as _clear, confirm_input as _confirm_input
+from ..actions.click import click as _click
+from ..actions.goto import goto as _goto
+from ..debug import debug_print as _debug_print
+
+class Session:
+    """
+    Browser automation context with its own driver, timeouts and settings.
+
+    Use it as a `with` block: the driver (given, or leased from a pool) becomes the
+    calling thread's default driver, so plain click()/type()/read() calls inside the
+    block use it too. The methods below pass the driver and timeouts explicitly.
+
+    Args:
+        driver: Driver to use (None = lease one from `pool`)
+        pool: DriverPool to lease from (None = the shared pool, see get_driver_pool)
+        timeout: Default element wait timeout in seconds
+        lease_timeout: Seconds to wait for a pooled driver (None = forever)
+        selector_type: Default selector type for the methods below
+        wait_engine: wait_for_element engine for wait() (None = module default)
+        **settings: Free-form values for the workflow, available as session.settings
+    """
+    def __init__(self, driver=None, pool=None, timeout=10, lease_timeout=None, selector_type="xpath",
+                 wait_engine=None, **settings):
+        self.driver = driver
+        self.pool = pool
+        self.timeout = timeout
+        self.lease_timeout = lease_timeout
+        self.selector_type = selector_type
+        self.wait_engine = wait_engine
+        self.settings = settings
+        self._leased = False
+        self._previous = None
+
+    def __enter__(self):
+        if self.driver is None:
+            if self.pool is None:
+                self.pool = get_driver_pool()
+            self.driver = self.pool.acquire(self.lease_timeout)
+            self._leased = True
+        self._previous = browser.set_thread_driver(self.driver)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        browser.set_thread_driver(self._previous)
+        if self._leased:
+            discard = exc_type is not None and issubclass(exc_type, WebDriverException)
+            self.pool.release(self.driver, discard)
+            self.driver = None
+            self._leased = False
+
+    def goto(self, url):
+        return _goto(url, driver=self.driver)
+
+    def read(self, selector, content_type="text", selector_type=None, timeout=None, stable_time=1.0, snapshot=False):
+        return browser.read(selector_type or self.selector_type, selector, content_type, driver=self.driver,
+                            timeout=timeout or self.timeout, stable_time=stable_time, snapshot=snapshot)
+
+    def click(self, selector, selector_type=None, timeout=None):
+        return _click(selector, timeout=timeout or self.timeout, driver=self.driver,
+                      selector_type=selector_type or self.selector_type)
+
+    def type(self, text, selector, selector_type=None, timeout=None):
+        return _type(text, driver=self.driver, selector=selector, selector_type=selector_type or self.selector_type,
+                     timeout=timeout or self.timeout)
+
+    def key(self, input_str, selector, selector_type=None, timeout=None):
+        return _key(input_str, driver=self.driver, selector=selector,
+                    selector_type=selector_type or self.selector_type, timeout=timeout or self.timeout)
+
+    def clear(self, selector, selector_type=None, timeout=None):
+        return _clear(driver=self.driver, selector=selector, selector_type=selector_type or self.selector_type,
+                      timeout=timeout or self.timeout)
+
+    def confirm_input(self, selector, selector_type=None, timeout=None):
+        return _confirm_input(driver=self.driver, selector=selector,
+                              selector_type=selector_type or self.selector_type, timeout=timeout or self.timeout)
+
+    def select_by_value(self, selector, value, selector_type=None, timeout=None):
+        return browser.select_by_value(selector_type or self.selector_type, selector, value, driver=self.driver,
+                                       timeout=timeout or self.timeout)
+
+    def wait(self, wait_type, selector, selector_type=None, timeout=None):
+        """wait_for_element on this session's driver; returns the element(s) or None."""
+        by = browser.get_selector_type(selector_type or self.selector_type)
+        return browser.wait_for_element(self.driver, wait_type, by, selector, timeout=timeout or self.timeout,
+                                        engine=self.wait_engine)
+
+    def get_elements(self, selector, selector_type=None, timeout=None):
+        return browser.get_elements(selector_type or self.selector_type, selector, driver=self.driver,
+                                    timeout=timeout or self.timeout)
+
+class JobResult:
+    """
+    Outcome of one run_jobs() input.
+
+    Attributes:
+        index: Position of the input in the list
+        item: The input value
+        value: What the workflow returned (None if it failed)
+        error: The exception the workflow raised, or None
+        duration: Seconds spent in the workflow, including the driver lease
+    """
+    __slots__ = ('index', 'item', 'value', 'error', 'duration')
+
+    def __init__(self, index, item, value=None, error=None, duration=0.0):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"{type(self.error).__name__}: {self.error}"
+        return f"JobResult({self.index}, {status}, {self.duration:.2f}s)"
+
+def run_jobs(workflow, inputs, workers=4, pool=None, headless=False, profile=None, on_result=None,
+             **session_kwargs):
+    """
+    Run `workflow(session, item)` for every item on `workers` browsers in parallel.
+
+    Each job gets its own Session leased from the pool. An exception in one job is
+    recorded in its JobResult and doesn't stop the others; a WebDriver error also
+    recycles the browser it happened on.
+
+    Args:
+        workflow: Callable taking (session, item)
+        inputs: Iterable of items
+        workers: Number of parallel threads (and browsers, when the pool is created here)
+        pool: DriverPool to lease from (None = a temporary pool of `workers` browsers)
+        headless: Run the temporary pool's browsers headless
+        profile: Driver profile of the temporary pool's browsers (see init_driver); profiles
+                 with a user_data_dir are rejected, since the browsers can't share one
+        on_result: Optional callable receiving each JobResult as it finishes
+        **session_kwargs: Passed to Session (timeout, selector_type, settings...)
+
+    Returns:
+        List of JobResults in input order.
+    """
+    inputs = list(inputs)
+    if not inputs:
+        return []
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(size=min(workers, len(inputs)), headless=headless, profile=profile)
+
+    def run(index, item):
+        start = time.perf_counter()
+        result = JobResult(index, item)
+        try:
+            with Session(pool=pool, **session_kwargs) as session:
+                result.value = workflow(session, item)
+        except Exception as e:
+            result.error = e
+            print(f"[JOB-ERROR] Job {index} failed: {type(e).__name__}: {e}")
+        result.duration = time.perf_counter() - start
+        _debug_print(f"Job {index} finished in {result.duration:.2f}s")
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception as e:
+                print(f"[JOB-ERROR] on_result failed for job {index}: {e}")
+        return result
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="PyAutomateJob") as executor:
+            results = list(executor.map(run, range(len(inputs)), inputs))
+    finally:
+        if own_pool:
+            pool.close()
+    failed = sum(not r.ok for r in results)
+    print(f"Ran {len(results)} jobs in {time.perf_counter() - start:.2f}s ({failed} failed)")
+    return results
+
+__all__ = ['Session', 'JobResult', 'run_jobs']
@@ -0,0 +1,196 @@
+import csv
+import json
+import time
+from collections import OrderedDict
+from selenium.common.exceptions import WebDriverException
+from .browser import get_driver, get_selector_type, wait_for_element, _FIND_JS, _TEXT_JS
+
+# Reads the currently rendered rows, then scrolls the table's container one step.
+# Returns [[keyAttribute, cellTexts, position] per row with cells, scrolledToEnd]. Cells
+# are <td>, else <th>, else ARIA grid cells; the container is the given one, else the
+# nearest scrollable ancestor of the first body row, else the page. position is the
+# row's offset from the top of the container's scrolled content, which stays the same
+# while a virtualized table re-renders the row at different DOM indexes. It is null for
+# header rows (in <thead>, only header cells, sticky, or outside the container), which
+# don't move with the content.
+_STEP_JS = """
+var by = arguments[0], locator = arguments[1], containerLocator = arguments[2], keyAttribute = arguments[3];
+var step = arguments[4];
+var rows = find(by, locator), found = [], out = [], body = null;
+for (var i = 0; i < rows.length; i++) {
+    var cells = rows[i].getElementsByTagName('td'), header = false;
+    if (!cells.length) cells = rows[i].querySelectorAll('[role=gridcell],[role=cell]');
+    if (!cells.length) {
+        header = true;
+        cells = rows[i].getElementsByTagName('th');
+        if (!cells.length) cells = rows[i].querySelectorAll('[role=columnheader]');
+    }
+    if (!cells.length) continue;
+    header = header || !!rows[i].closest('thead') || getComputedStyle(rows[i]).position === 'sticky';
+    if (!header && !body) body = rows[i];
+    found.push([rows[i], cells, header]);
+}
+var box = containerLocator ? find(by, containerLocator)[0] : null;
+var start = body || (rows.length ? rows[0] : null);
+for (var n = start ? start.parentElement : null; !box && n && n !== document.body; n = n.parentElement) {
+    var overflow = getComputedStyle(n).overflowY;
+    if ((overflow === 'auto' || overflow === 'scroll') && n.scrollHeight > n.clientHeight) box = n;
+}
+var page = !box;
+if (page) box = document.scrollingElement || document.documentElement;
+var origin = page ? 0 : box.getBoundingClientRect().top;
+for (var k = 0; k < found.length; k++) {
+    var row = found[k][0], fixed = found[k][2] || (!page && !box.contains(row));
+    out.push([keyAttribute ? row.getAttribute(keyAttribute) : null, Array.prototype.map.call(found[k][1], text),
+              fixed ? null : Math.round(row.getBoundingClientRect().top - origin + box.scrollTop)]);
+}
+var before = box.scrollTop;
+box.scrollTop = before + (step || Math.max(1, Math.floor(box.clientHeight * 0.8)));
+return [out, box.scrollTop === before];
+"""
+
+def _rows_locator(selector, selector_type):
+    """Locator for the <tr> and ARIA rows under a table or grid selector."""
+    if selector_type == "xpath":
+        return f"{selector}//tr | {selector}//*[@role='row']"
+    if selector_type == "css":
+        return f"{selector} tr, {selector} [role=row]"
+    raise ValueError(f"Pass rows_selector for selector_type {selector_type!r}")
+
+def iter_table_rows(selector, selector_type="xpath", driver=None, rows_selector=None, container=None,
+                    key=None, key_attribute=None, scroll_step=None, settle_time=0.3, max_idle=3,
+                    max_keys=10000, max_rows=None, timeout=20, scroll_timeout=300):
+    """
+    Yield the rows of a virtualized or infinite-scroll table as they render.
+
+    Each step reads the rendered rows and scrolls the container in one script call.
+    Rows already seen are skipped. Scrolling continues while the container can still
+    scroll; once it is at the end, iteration stops after `max_idle` steps in a row bring
+    no new rows (giving lazy loading time to append more). Only the keys of the last
+    `max_keys` rows are remembered, so memory stays bounded however long the table is.
+
+    Rows are told apart by `key`, else `key_attribute`, else their position in the
+    container's content, so identical rows at different positions are all yielded.
+    Header rows (in <thead>, with only header cells, sticky, or outside the scrolling
+    container) don't move with the content and are told apart by their texts instead.
+    Position keys assume rows above don't change height while streaming; pass a key
+    for tables where they do.
+
+    Args:
+        selector: Table or grid selector
+        selector_type: "xpath" or "css" ("id"/"class" need rows_selector)
+        driver: WebDriver (default: get_driver())
+        rows_selector: Row locator of the same type (default: <tr> and [role=row] under selector)
+        container: Scrollable container locator of the same type (default: nearest scrollable ancestor)
+        key: Optional callable mapping a row's cell list to its dedup key
+        key_attribute: Row attribute holding a unique key (e.g. "aria-rowindex", "data-id")
+        scroll_step: Pixels per scroll (default: 80% of the container height)
+        settle_time: Seconds to let new rows render after each scroll
+        max_idle: Steps without new rows at the end of the container before stopping
+        max_keys: Number of recent row keys kept for deduplication
+        max_rows: Stop after this many rows
+        timeout: Seconds to wait for the first rows
+        scroll_timeout: Seconds after which streaming stops even if the end was not reached
+
+    Yields:
+        Lists of stripped cell texts, like the rows of read(..., "table_data").
+    """
+    if driver is None:
+        driver = get_driver()
+    if driver is None:
+        raise ValueError("Driver is not initialized")
+    by = get_selector_type(selector_type)
+    locator = rows_selector or _rows_locator(selector, selector_type)
+    if not wait_for_element(driver, "all_present", by, locator, timeout=timeout):
+        print(f"No rows found under {selector}")
+        return
+
+    seen = OrderedDict()
+    idle = 0
+    yielded = 0
+    deadline = time.monotonic() + scroll_timeout
+    while idle < max_idle:
+        if time.monotonic() >= deadline:
+            print(f"[READ-WARN] Table stream stopped after {scroll_timeout}s before reaching the end")
+            return
+        try:
+            rows, at_end = driver.execute_script(_FIND_JS + _TEXT_JS + _STEP_JS, by, locator, container, key_attribute,
+                                                 scroll_step)
+        except WebDriverException as e:
+            print(f"[READ-ERROR] Table stream stopped: {type(e).__name__}: {e}")
+            return
+        new = 0
+        for attribute, cells, position in rows:
+            cells = [c.strip() for c in cells]
+            if key is not None:
+                row_key = ('key', key(cells))
+            elif attribute is not None:
+                row_key = ('attribute', attribute)
+            elif position is None:
+                # Header rows stay in place while the body scrolls: the same content is the same row
+                row_key = ('header', tuple(cells))
+            else:
+                row_key = ('position', position)
+            if row_key in seen:
+                seen.move_to_end(row_key)
+                continue
+            seen[row_key] = None
+            if len(seen) > max_keys:
+                seen.popitem(last=False)
+            new += 1
+            yield cells
+            yielded += 1
+            if max_rows is not None and yielded >= max_rows:
+                return
+        idle = idle + 1 if at_end and not new else 0
+        time.sleep(settle_time)
+
+def write_rows_csv(rows, path, headers=None, encoding="utf-8"):
+    """
+    Write rows to a CSV file as they arrive (rows can be a generator).
+
+    Args:
+        rows: Iterable of cell lists or dicts
+        path: Output file path
+        headers: Optional header row; also the column order for dict rows
+        encoding: File encoding ("utf-8-sig" for Excel)
+
+    Returns:
+        Number of rows written (without the header).
+    """
+    count = 0
+    with open(path, "w", newline="", encoding=encoding) as f:
+        writer = csv.writer(f)
+        if headers:
+            writer.writerow(headers)
+        for row in rows:
+            if isinstance(row, dict):
+                row = [row.get(h, "") for h in headers] if headers else list(row.values())
+            writer.writerow(row)
+            count += 1
+    return count
+
+def write_rows_jsonl(rows, path, headers=None, encoding="utf-8"):
+    """
+    Write rows to a JSON Lines file as they arrive (rows can be a generator).
+
+    Args:
+        rows: Iterable of cell lists or dicts
+        path: Output file path
+        headers: Optional column names; list rows are then written as objects
+        encoding: File encoding
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    with open(path, "w", encoding=encoding) as f:
+        for row in rows:
+            if headers and not isinstance(row, dict):
+                row = dict(zip(headers, row))
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+__all__ = ['iter_table_rows', 'write_rows_csv', 'write_rows_jsonl']
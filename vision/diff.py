@@ -0,0 +1,54 @@
+import cv2
+import numpy as np
+
+def tile_max(img, tile):
+    """
+    Reduce a 2D image to the maximum of each tile x tile block.
+    Partial tiles at the right and bottom edges are included.
+    """
+    h, w = img.shape[:2]
+    gh, gw = -(-h // tile), -(-w // tile)
+    if (gh * tile, gw * tile) != (h, w):
+        padded = np.zeros((gh * tile, gw * tile), dtype=img.dtype)
+        padded[:h, :w] = img
+        img = padded
+    return img.reshape(gh, tile, gw, tile).max(axis=(1, 3))
+
+def changed_tiles(prev, curr, tile=32, tolerance=0):
+    """
+    Compare two frames of the same shape tile by tile.
+
+    Args:
+        prev: Previous frame (gray or BGR)
+        curr: Current frame (same shape as prev)
+        tile: Tile size in pixels
+        tolerance: Largest per-pixel difference still treated as unchanged
+
+    Returns:
+        Bool grid (rows, cols), True where a tile changed.
+    """
+    diff = cv2.absdiff(prev, curr)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    return tile_max(diff, tile) > tolerance
+
+def tile_boxes(mask, tile, shape):
+    """
+    Bounding boxes of each connected group of True tiles.
+
+    Args:
+        mask: Bool tile grid, as returned by changed_tiles
+        tile: Tile size in pixels
+        shape: Frame shape, boxes are clipped to it
+
+    Returns:
+        List of (x1, y1, x2, y2) pixel boxes (x2/y2 exclusive).
+    """
+    count, _, stats, _ = cv2.connectedComponentsWithStats(mask.astype(np.uint8), connectivity=8)
+    boxes = []
+    for x, y, w, h, _ in stats[1:count]:
+        boxes.append((int(x) * tile, int(y) * tile,
+                      min(shape[1], int(x + w) * tile), min(shape[0], int(y + h) * tile)))
+    return boxes
+
+__all__ = ['tile_max', 'changed_tiles', 'tile_boxes']
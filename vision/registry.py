@@ -0,0 +1,126 @@
+import os
+import threading
+from collections import OrderedDict
+import cv2
+import numpy as np
+from ..debug import debug_print as _debug_print
+
+class Template:
+    """
+    Template image with everything the matchers need precomputed.
+
+    Attributes:
+        bgr: Template image (BGR)
+        gray: Grayscale template
+        mask: Binary mask built from the alpha channel, or None when the image has no alpha
+        edges: Canny edge map of the grayscale template
+        edge_count: Number of edge pixels
+        edge_ratio: Edge pixels / template pixels
+        path: Source file, if loaded from disk
+        mtime: Modification time (ns) of the source file when it was loaded
+    """
+    __slots__ = ('bgr', 'gray', 'mask', 'edges', 'edge_count', 'edge_ratio', 'path', 'mtime')
+
+    def __init__(self, bgr, mask=None, path=None, mtime=None):
+        self.bgr = bgr
+        self.mask = mask
+        self.gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        self.edges = cv2.Canny(self.gray, 100, 200)
+        self.edge_count = int(np.count_nonzero(self.edges))
+        self.edge_ratio = self.edge_count / self.edges.size
+        self.path = path
+        self.mtime = mtime
+
+    @property
+    def shape(self):
+        return self.gray.shape
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a template from an image file. Returns None if the file can't be read."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            return None
+        if img.ndim == 2:
+            return cls(cv2.cvtColor(img, cv2.COLOR_GRAY2BGR), None, path, mtime)
+        bgr = np.ascontiguousarray(img[..., :3])
+        mask = None
+        if img.shape[2] == 4:
+            _, mask = cv2.threshold(img[..., 3], 1, 255, cv2.THRESH_BINARY)
+        return cls(bgr, mask, path, mtime)
+
+class TemplateRegistry:
+    """
+    LRU cache of preprocessed templates keyed by file path.
+
+    A cached template is reloaded when its file's modification time changes.
+
+    Args:
+        maxsize: Maximum number of templates kept in memory
+    """
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the preprocessed template for `path`, or None if it can't be loaded."""
+        path = os.path.normpath(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            template = self._templates.get(path)
+            if template is not None and mtime is not None and template.mtime == mtime:
+                self._templates.move_to_end(path)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        if template is not None:
+            _debug_print(f"Template {path} changed on disk, reloading")
+        template = Template.from_file(path) if mtime is not None else None
+        with self._lock:
+            if template is None:
+                self._templates.pop(path, None)
+                return None
+            self._templates[path] = template
+            self._templates.move_to_end(path)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def invalidate(self, path=None):
+        """Drop one template (or all of them when path is None)."""
+        with self._lock:
+            if path is None:
+                self._templates.clear()
+            else:
+                self._templates.pop(os.path.normpath(path), None)
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._templates), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._templates)
+
+_registry = TemplateRegistry()
+
+def get_template_registry():
+    """Return the shared template registry."""
+    return _registry
+
+def load_template(path):
+    """Load a template through the shared registry."""
+    return _registry.get(path)
+
+__all__ = ['Template', 'TemplateRegistry', 'get_template_registry', 'load_template']
@@ -1,54 +1,71 @@
 import cv2, numpy as np
-import mss
+import os
 import time
-from ..capture.ocr import last_screenshot_region, ocr
-from ..capture.screenshot import screenshot
-from ..debug import debug_print as _debug_print, set_debug_mode
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ..capture import ocr as _ocr_module
+from ..capture.ocr import ocr
+from ..capture.ocr_result import OCRResult
+from ..capture.stream import next_frame
+from ..debug import debug_print as _debug_print, set_debug_mode, get_debug_mode
+from .registry import Template, load_template
+from .diff import changed_tiles, tile_boxes
 
 __all__ = [
     'get_img_center_coords',
     'get_text_center_coords',
+    'find_all_templates',
+    'find_any',
+    'find_all',
     'wait_for_text',
     'wait_for_screen_change',
+    'set_pyramid_search',
     'set_debug_mode'
 ]
 
-def get_text_center_coords(ocr_result, target_text: str, scale_factor: int = 2, x_offset: int = 0, y_offset: int = 0):
-    full_text = ''.join([t for t in ocr_result['text'] if t.strip()])
-    _debug_print(f"Looking for text: {target_text}\nFound text: {full_text}")
-    
-    # Print all detected text with their positions
-    _debug_print("\nDetected text blocks:")
-    for i,(text,conf) in enumerate(zip(ocr_result['text'], ocr_result['conf'])):
-        if text.strip():
-            _debug_print(f"'{text}': {conf}% at ({ocr_result['left'][i]}, {ocr_result['top'][i]}) size {ocr_result['width'][i]}x{ocr_result['height'][i]}")
+def get_text_center_coords(ocr_result, target_text: str, scale_factor: int = 2, x_offset: int = 0, y_offset: int = 0,
+                           region: dict = None):
+    ocr_result = OCRResult.from_dict(ocr_result)
+    # Screen region the OCR image was taken from (defaults to the last region passed to ocr())
+    if region is None:
+        region = ocr_result.region
+    last_screenshot_region = region if region is not None else _ocr_module.last_screenshot_region
+    if get_debug_mode():
+        full_text = ''.join([t for t in ocr_result['text'] if t.strip()])
+        _debug_print(f"Looking for text: {target_text}\nFound text: {full_text}")
+
+        # Print all detected text with their positions
+        _debug_print("\nDetected text blocks:")
+        for i,(text,conf) in enumerate(zip(ocr_result['text'], ocr_result['conf'])):
+            if text.strip():
+                _debug_print(f"'{text}': {conf}% at ({ocr_result['left'][i]}, {ocr_result['top'][i]}) size {ocr_result['width'][i]}x{ocr_result['height'][i]}")
     
-    # Try exact match first
-    for i,(text,_) in enumerate(zip(ocr_result['text'], ocr_result['conf'])):
-        if text.strip() and text == target_text:
-            if last_screenshot_region is not None:
-                r = last_screenshot_region
-                # Calculate center in original coordinates first
-                center_x = ocr_result['left'][i] + ocr_result['width'][i] / 2
-                center_y = ocr_result['top'][i] + ocr_result['height'][i] / 2
-                
-                # Then scale down and add offsets
-                cx = r['left'] + int(center_x / scale_factor) + x_offset
-                cy = r['top'] + int(center_y / scale_factor) + y_offset
-            else:
-                # Calculate center in original coordinates first
-                center_x = ocr_result['left'][i] + ocr_result['width'][i] / 2
-                center_y = ocr_result['top'][i] + ocr_result['height'][i] / 2
-                
-                # Then scale down and add offsets
-                cx = int(center_x / scale_factor) + x_offset
-                cy = int(center_y / scale_factor) + y_offset
-            _debug_print(f"Found exact match. Original position: ({center_x}, {center_y}), Scaled: ({cx}, {cy})")
-            return (cx, cy)
+    # Try exact match first (through the result's text index)
+    for i in (ocr_result.find(target_text) if target_text.strip() else []):
+        if last_screenshot_region is not None:
+            r = last_screenshot_region
+            # Calculate center in original coordinates first
+            center_x = ocr_result['left'][i] + ocr_result['width'][i] / 2
+            center_y = ocr_result['top'][i] + ocr_result['height'][i] / 2
+            
+            # Then scale down and add offsets
+            cx = r['left'] + int(center_x / scale_factor) + x_offset
+            cy = r['top'] + int(center_y / scale_factor) + y_offset
+        else:
+            # Calculate center in original coordinates first
+            center_x = ocr_result['left'][i] + ocr_result['width'][i] / 2
+            center_y = ocr_result['top'][i] + ocr_result['height'][i] / 2
+            
+            # Then scale down and add offsets
+            cx = int(center_x / scale_factor) + x_offset
+            cy = int(center_y / scale_factor) + y_offset
+        _debug_print(f"Found exact match. Original position: ({center_x}, {center_y}), Scaled: ({cx}, {cy})")
+        return (cx, cy)
     
     # If exact match fails, try partial match
-    for i,(text,conf) in enumerate(zip(ocr_result['text'], ocr_result['conf'])):
-        if text.strip() and target_text in text and conf > 40:  # Only consider matches with confidence > 40%
+    for i in ocr_result.find_substring(target_text, min_conf=40):  # Only consider matches with confidence > 40%
+        text = ocr_result.text[i]
+        if text.strip():
             # Calculate the position of the target text within the detected text
             start_pos = text.find(target_text)
             text_width = ocr_result['width'][i]
@@ -78,153 +95,409 @@ def get_text_center_coords(ocr_result, target_text: str, scale_factor: int = 2,
     _debug_print("No match found for text:", target_text)
     return None
 
-def get_img_center_coords(template_bgr: np.ndarray,
-                        mask:         np.ndarray,
-                        screen_img:   np.ndarray = None,
-                        x_offset:     int = 0,
-                        y_offset:     int = 0,
-                        timeout:      float = None):
+# Template matching methods tried by get_img_center_coords
+_METHODS = [
+    ('TM_SQDIFF_NORMED', cv2.TM_SQDIFF_NORMED),
+    ('TM_CCOEFF_NORMED', cv2.TM_CCOEFF_NORMED),
+    ('TM_CCORR_NORMED', cv2.TM_CCORR_NORMED)
+]
+
+# Pyramid search settings
+_pyramid_search = False
+_PYRAMID_LEVELS = 2         # Coarse frame is downscaled by 2**levels
+_PYRAMID_MIN_TEMPLATE = 8   # Smallest coarse template side, fewer levels are used below this
+_PYRAMID_CANDIDATES = 3     # Coarse peaks refined at full resolution
+
+def set_pyramid_search(enabled: bool):
+    """Enable or disable coarse-to-fine pyramid search by default in get_img_center_coords."""
+    global _pyramid_search
+    _pyramid_search = bool(enabled)
+
+def _match_extrema(screen_gray, screen_edges, templ_gray, template_edges, mask):
     """
-    Handles both masked and unmasked template matching with enhanced validation and fallback for low-edge templates.
-    Returns coordinates if found, None if not found.
-    
-    Args:
-        template_bgr: The template image to search for
-        mask: Optional mask for the template
-        screen_img: Optional screenshot to search in (will take new screenshot if None)
-        x_offset: X offset to add to found coordinates
-        y_offset: Y offset to add to found coordinates
-        timeout: Optional timeout in seconds. If provided, will keep trying until timeout is reached.
+    Run every matching method on the gray and edge images.
+    Returns {method_name: (minMaxLoc(gray result), minMaxLoc(edge result))}.
     """
-    if screen_img is None:
-        screen_img, region = screenshot()
-    else:
-        region = None
-    screen_gray  = cv2.cvtColor(screen_img,  cv2.COLOR_BGR2GRAY)
-    templ_gray   = cv2.cvtColor(template_bgr,cv2.COLOR_BGR2GRAY)
+    extrema = {}
+    for method_name, method in _METHODS:
+        try:
+            # Match on both original and edge-detected images
+            result = cv2.matchTemplate(screen_gray, templ_gray, method, mask=mask)
+            edge_result = cv2.matchTemplate(screen_edges, template_edges, method, mask=mask)
+            extrema[method_name] = (cv2.minMaxLoc(result), cv2.minMaxLoc(edge_result))
+        except Exception as e:
+            _debug_print(f"Error with {method_name}: {e}")
+    return extrema
+
+def _merge_extrema(a, b):
+    """Combine two minMaxLoc results into the extrema of their union."""
+    min_val, min_loc = (b[0], b[2]) if b[0] < a[0] else (a[0], a[2])
+    max_val, max_loc = (b[1], b[3]) if b[1] > a[1] else (a[1], a[3])
+    return (min_val, max_val, min_loc, max_loc)
+
+def _pyramid_extrema(screen_gray, screen_edges, templ_gray, template_edges, mask,
+                     levels=_PYRAMID_LEVELS, candidates=_PYRAMID_CANDIDATES):
+    """
+    Coarse-to-fine version of _match_extrema.
+
+    Matches a downscaled template against a downscaled screen, then runs the full
+    resolution matchers only in small windows around the best coarse peaks.
+    Falls back to the full search when the template is too small to downscale.
+    """
+    th, tw = templ_gray.shape
+    sh, sw = screen_gray.shape
+    factor = 2 ** levels
+    while factor > 1 and (th // factor < _PYRAMID_MIN_TEMPLATE or tw // factor < _PYRAMID_MIN_TEMPLATE):
+        factor //= 2
+    if factor == 1:
+        return _match_extrema(screen_gray, screen_edges, templ_gray, template_edges, mask)
+
+    coarse_screen = cv2.resize(screen_gray, (sw // factor, sh // factor), interpolation=cv2.INTER_AREA)
+    coarse_templ = cv2.resize(templ_gray, (tw // factor, th // factor), interpolation=cv2.INTER_AREA)
+    coarse_mask = None
+    if mask is not None:
+        coarse_mask = cv2.resize(mask, (tw // factor, th // factor), interpolation=cv2.INTER_NEAREST)
+        if not np.any(coarse_mask):
+            return _match_extrema(screen_gray, screen_edges, templ_gray, template_edges, mask)
+
+    method = cv2.TM_CCORR_NORMED if coarse_mask is not None else cv2.TM_CCOEFF_NORMED
+    response = cv2.matchTemplate(coarse_screen, coarse_templ, method, mask=coarse_mask)
+    response = np.nan_to_num(response, nan=-1.0, posinf=-1.0, neginf=-1.0)
 
+    # Pick the best coarse peaks, suppressing the neighbourhood of each one
+    ch, cw = coarse_templ.shape
+    margin = 2 * factor + 2
+    windows = []
+    for _ in range(candidates):
+        _, peak, _, (x, y) = cv2.minMaxLoc(response)
+        if peak <= -1:
+            break
+        windows.append((max(0, x * factor - margin), max(0, y * factor - margin),
+                        min(sw, x * factor + tw + margin), min(sh, y * factor + th + margin)))
+        response[max(0, y - ch // 2):y + ch // 2 + 1, max(0, x - cw // 2):x + cw // 2 + 1] = -1
+    _debug_print(f"Pyramid search: factor {factor}, refining {len(windows)} window(s)")
+
+    merged = {}
+    for x1, y1, x2, y2 in windows:
+        extrema = _match_extrema(screen_gray[y1:y2, x1:x2], screen_edges[y1:y2, x1:x2],
+                                 templ_gray, template_edges, mask)
+        for method_name, (gray_mm, edge_mm) in extrema.items():
+            gray_mm = (gray_mm[0], gray_mm[1], (gray_mm[2][0] + x1, gray_mm[2][1] + y1), (gray_mm[3][0] + x1, gray_mm[3][1] + y1))
+            edge_mm = (edge_mm[0], edge_mm[1], (edge_mm[2][0] + x1, edge_mm[2][1] + y1), (edge_mm[3][0] + x1, edge_mm[3][1] + y1))
+            if method_name in merged:
+                merged[method_name] = (_merge_extrema(merged[method_name][0], gray_mm),
+                                       _merge_extrema(merged[method_name][1], edge_mm))
+            else:
+                merged[method_name] = (gray_mm, edge_mm)
+
+    # Outside TM_SQDIFF_NORMED the edge minimum is the worst location of the whole frame,
+    # which never sits next to the match. Windows can't reproduce it, so place it out of
+    # reach to keep the distance check behaving like the full search.
+    for method_name, method in _METHODS:
+        if method != cv2.TM_SQDIFF_NORMED and method_name in merged:
+            gray_mm, edge_mm = merged[method_name]
+            merged[method_name] = (gray_mm, (edge_mm[0], edge_mm[1], (-sw, -sh), edge_mm[3]))
+    return merged
+
+def _as_template(template, mask=None):
+    """Accept a Template, a BGR array (with optional mask) or an 'img/...' path."""
+    if template is None or isinstance(template, Template):
+        return template
+    if isinstance(template, str):
+        return load_template(template.lstrip('/'))
+    return Template(template, mask)
+
+def _template_usable(template, screen_shape):
+    """Check that a template can be matched against a screen of the given shape."""
+    templ_h, templ_w = template.gray.shape
     # Check if template is larger than screen
-    if templ_gray.shape[0] > screen_gray.shape[0] or templ_gray.shape[1] > screen_gray.shape[1]:
+    if templ_h > screen_shape[0] or templ_w > screen_shape[1]:
         _debug_print("Template image is larger than screen")
-        return None
+        return False
 
     # Validate mask if provided
-    has_valid_mask = False
-    if mask is not None:
-        if mask.shape != templ_gray.shape[:2]:
+    if template.mask is not None:
+        if template.mask.shape != template.gray.shape[:2]:
             _debug_print("Mask shape doesn't match template shape")
-            return None
-        if not np.any(mask):  # Check if mask is empty
+            return False
+        if not np.any(template.mask):  # Check if mask is empty
             _debug_print("Empty mask")
-            return None
-        has_valid_mask = True
+            return False
+    return True
 
-    # Apply edge detection to both template and screen
-    template_edges = cv2.Canny(templ_gray, 100, 200)
-    screen_edges = cv2.Canny(screen_gray, 100, 200)
+def _locate_template(template, screen_gray, screen_edges, pyramid=False):
+    """
+    Run the matchers for one template against a prepared gray/edge screen.
+    Returns (loc, val, method_name, edge_val) of the accepted match, or None.
+    """
+    if pyramid:
+        extrema = _pyramid_extrema(screen_gray, screen_edges, template.gray, template.edges, template.mask)
+    else:
+        extrema = _match_extrema(screen_gray, screen_edges, template.gray, template.edges, template.mask)
+    return _select_match(template, extrema)
 
-    # Count edge pixels in template
-    edge_pixel_count = np.count_nonzero(template_edges)
-    edge_ratio = edge_pixel_count / template_edges.size
-    _debug_print(f"Template edge pixel count: {edge_pixel_count}, ratio: {edge_ratio:.3f}")
+def _select_match(template, extrema):
+    """
+    Validate the per-method extrema of one template.
+    Returns (loc, val, method_name, edge_val) of the accepted match, or None.
+    """
+    edge_ratio = template.edge_ratio
 
     # Adjust thresholds based on image dimensions
-    h, w = templ_gray.shape
+    h, w = template.gray.shape
     is_text_like = w > h * 3  # If width is more than 3x height, consider it text-like
-    _debug_print(f"Image is {'text-like' if is_text_like else 'icon-like'}")
-    
+
     # Adjust thresholds for text-like images
     edge_threshold = 0.3 if is_text_like else 0.5  # Lower edge threshold for text
     distance_threshold = 20 if is_text_like else 10  # More lenient distance for text
     fallback_edge_ratio = 0.1 if is_text_like else 0.05  # More lenient edge ratio for text
 
-    # Try different template matching methods
-    methods = [
-        ('TM_SQDIFF_NORMED', cv2.TM_SQDIFF_NORMED),
-        ('TM_CCOEFF_NORMED', cv2.TM_CCOEFF_NORMED),
-        ('TM_CCORR_NORMED', cv2.TM_CCORR_NORMED)
-    ]
+    valid_matches = []
+    fallback_matches = []
 
-    def try_match():
-        best_val = -1
-        best_loc = None
-        best_method = None
-        valid_matches = []
-        fallback_matches = []
+    for method_name, method in _METHODS:
+        if method_name not in extrema:
+            continue
+        (min_val, max_val, min_loc, max_loc), (edge_min_val, edge_max_val, edge_min_loc, edge_max_loc) = extrema[method_name]
 
-        for method_name, method in methods:
-            try:
-                # Match on both original and edge-detected images
-                result = cv2.matchTemplate(screen_gray, templ_gray, method, mask=mask if has_valid_mask else None)
-                edge_result = cv2.matchTemplate(screen_edges, template_edges, method, mask=mask if has_valid_mask else None)
-                
-                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-                edge_min_val, edge_max_val, edge_min_loc, edge_max_loc = cv2.minMaxLoc(edge_result)
-                
-                # For TM_SQDIFF_NORMED, the best match is the minimum value
-                if method == cv2.TM_SQDIFF_NORMED:
-                    val = 1 - min_val  # Convert to similarity score
-                    edge_val = 1 - edge_min_val
-                    loc = min_loc
-                else:
-                    val = max_val
-                    edge_val = edge_max_val
-                    loc = max_loc
+        # For TM_SQDIFF_NORMED, the best match is the minimum value
+        if method == cv2.TM_SQDIFF_NORMED:
+            val = 1 - min_val  # Convert to similarity score
+            edge_val = 1 - edge_min_val
+            loc = min_loc
+        else:
+            val = max_val
+            edge_val = edge_max_val
+            loc = max_loc
 
-                _debug_print(f"{method_name}: val={val:.2f}, edge_val={edge_val:.2f}, loc={loc}, edge_loc={edge_min_loc if method == cv2.TM_SQDIFF_NORMED else edge_max_loc}")
+        _debug_print(f"{method_name}: val={val:.2f}, edge_val={edge_val:.2f}, loc={loc}, edge_loc={edge_min_loc if method == cv2.TM_SQDIFF_NORMED else edge_max_loc}")
 
-                # Skip invalid values
-                if not np.isfinite(val) or not np.isfinite(edge_val):
-                    _debug_print(f"Skipping {method_name} due to invalid confidence value")
-                    continue
+        # Skip invalid values
+        if not np.isfinite(val) or not np.isfinite(edge_val):
+            _debug_print(f"Skipping {method_name} due to invalid confidence value")
+            continue
 
-                # Only consider matches with high confidence in both original and edge detection
-                if val > 0.8 and edge_val > edge_threshold:
-                    # Calculate the distance between the two match locations
-                    loc_distance = ((loc[0] - edge_min_loc[0])**2 + (loc[1] - edge_min_loc[1])**2)**0.5
-                    if loc_distance < distance_threshold:
-                        valid_matches.append((val, loc, method_name, edge_val))
+        # Only consider matches with high confidence in both original and edge detection
+        if val > 0.8 and edge_val > edge_threshold:
+            # Calculate the distance between the two match locations
+            loc_distance = ((loc[0] - edge_min_loc[0])**2 + (loc[1] - edge_min_loc[1])**2)**0.5
+            if loc_distance < distance_threshold:
+                valid_matches.append((val, loc, method_name, edge_val))
+
+        # Fallback: if template has very little edge content, allow strong original match
+        elif val > 0.9 and edge_ratio < fallback_edge_ratio:
+            fallback_matches.append((val, loc, method_name, edge_val))
+
+    if not valid_matches:
+        if fallback_matches:
+            _debug_print("Using fallback match due to low edge content.")
+            valid_matches = fallback_matches
+        else:
+            _debug_print("No valid matches found with confidence > 0.8")
+            return None
 
-                # Fallback: if template has very little edge content, allow strong original match
-                elif val > 0.9 and edge_ratio < fallback_edge_ratio:
-                    fallback_matches.append((val, loc, method_name, edge_val))
+    # Sort matches by confidence
+    valid_matches.sort(reverse=True)
+    best_val, best_loc, best_method, best_edge_val = valid_matches[0]
 
+    # Additional validation: Check if there are multiple high-confidence matches
+    if len(valid_matches) > 1:
+        second_best_val = valid_matches[1][0]
+        if abs(best_val - second_best_val) < 0.1:  # If multiple matches are very close
+            _debug_print("Multiple high-confidence matches found, rejecting to avoid ambiguity")
+            _debug_print(f"Best match: {best_val:.2f} (edge: {best_edge_val:.2f}) at {best_loc}")
+            _debug_print(f"Second best: {second_best_val:.2f} (edge: {valid_matches[1][3]:.2f}) at {valid_matches[1][1]}")
+            return None
+
+    return best_loc, best_val, best_method, best_edge_val
+
+def _match_center(template, match, region, x_offset, y_offset):
+    """Convert an accepted match to screen coordinates of the template center."""
+    best_loc, best_val, best_method, best_edge_val = match
+    h, w = template.gray.shape
+    cx = best_loc[0] + w//2 + x_offset
+    cy = best_loc[1] + h//2 + y_offset
+
+    # If we have a region from screenshot, use its offset
+    if region is not None:
+        cx += region['left']
+        cy += region['top']
+
+    _debug_print(f"Found! Method: {best_method}, Confidence: {best_val:.2f} (edge: {best_edge_val:.2f}), Coordinates: ({cx},{cy})")
+    return (cx, cy)
+
+def _tile_extrema(response, tile):
+    """
+    Per-tile minimum and maximum of a response map, with their locations.
+    Returns (min_vals, min_xs, min_ys, max_vals, max_xs, max_ys) grids.
+    """
+    h, w = response.shape
+    gh, gw = -(-h // tile), -(-w // tile)
+    lo = np.full((gh * tile, gw * tile), np.inf, dtype=np.float32)
+    hi = np.full((gh * tile, gw * tile), -np.inf, dtype=np.float32)
+    lo[:h, :w] = np.nan_to_num(response, nan=np.inf)
+    hi[:h, :w] = np.nan_to_num(response, nan=-np.inf)
+    lo = lo.reshape(gh, tile, gw, tile).transpose(0, 2, 1, 3).reshape(gh, gw, tile * tile)
+    hi = hi.reshape(gh, tile, gw, tile).transpose(0, 2, 1, 3).reshape(gh, gw, tile * tile)
+    imin = lo.argmin(axis=2)
+    imax = hi.argmax(axis=2)
+    min_vals = np.take_along_axis(lo, imin[..., None], axis=2)[..., 0]
+    max_vals = np.take_along_axis(hi, imax[..., None], axis=2)[..., 0]
+    row0 = (np.arange(gh) * tile)[:, None]
+    col0 = (np.arange(gw) * tile)[None, :]
+    return (min_vals, col0 + imin % tile, row0 + imin // tile,
+            max_vals, col0 + imax % tile, row0 + imax // tile)
+
+class _IncrementalMatcher:
+    """
+    Incremental matcher for the timeout polling loop.
+
+    Keeps the per-tile extrema of every response map (gray and edge, per method) of one
+    template. On a new frame only the tiles of the response maps whose screen area
+    changed are recomputed, and an unchanged frame skips matching entirely.
+    """
+    TILE = 64                 # Response map tile size
+    DIFF_TILE = 32            # Screen tile size used for change detection
+    FULL_REMATCH_RATIO = 0.5  # Rematch the whole frame above this fraction of changed tiles
+
+    def __init__(self, template, screen_gray, screen_edges):
+        self.template = template
+        self.full(screen_gray, screen_edges)
+
+    def full(self, screen_gray, screen_edges):
+        self.gray = screen_gray
+        self.edges = screen_edges
+        self.grids = {}
+        for method_name, method in _METHODS:
+            try:
+                result = cv2.matchTemplate(screen_gray, self.template.gray, method, mask=self.template.mask)
+                edge_result = cv2.matchTemplate(screen_edges, self.template.edges, method, mask=self.template.mask)
             except Exception as e:
                 _debug_print(f"Error with {method_name}: {e}")
                 continue
+            self.grids[method_name] = (list(_tile_extrema(result, self.TILE)),
+                                       list(_tile_extrema(edge_result, self.TILE)))
 
-        if not valid_matches:
-            if fallback_matches:
-                _debug_print("Using fallback match due to low edge content.")
-                valid_matches = fallback_matches
-            else:
-                _debug_print("No valid matches found with confidence > 0.8")
-                return None
-
-        # Sort matches by confidence
-        valid_matches.sort(reverse=True)
-        best_val, best_loc, best_method, best_edge_val = valid_matches[0]
-
-        # Additional validation: Check if there are multiple high-confidence matches
-        if len(valid_matches) > 1:
-            second_best_val = valid_matches[1][0]
-            if abs(best_val - second_best_val) < 0.1:  # If multiple matches are very close
-                _debug_print("Multiple high-confidence matches found, rejecting to avoid ambiguity")
-                _debug_print(f"Best match: {best_val:.2f} (edge: {best_edge_val:.2f}) at {best_loc}")
-                _debug_print(f"Second best: {second_best_val:.2f} (edge: {valid_matches[1][3]:.2f}) at {valid_matches[1][1]}")
-                return None
-
-        h, w = templ_gray.shape
-        cx = best_loc[0] + w//2 + x_offset
-        cy = best_loc[1] + h//2 + y_offset
-        
-        # If we have a region from screenshot, use its offset
-        if region is not None:
-            cx += region['left']
-            cy += region['top']
-            
-        _debug_print(f"Found! Method: {best_method}, Confidence: {best_val:.2f} (edge: {best_edge_val:.2f}), Coordinates: ({cx},{cy})")
-        return (cx, cy)
+    def update(self, screen_gray):
+        """Bring the matcher up to date with a new frame. Returns False if the frame didn't change."""
+        if screen_gray.shape != self.gray.shape:
+            self.full(screen_gray, cv2.Canny(screen_gray, 100, 200))
+            return True
+        changed = changed_tiles(self.gray, screen_gray, self.DIFF_TILE)
+        if not changed.any():
+            return False
+        if changed.mean() > self.FULL_REMATCH_RATIO:
+            self.full(screen_gray, cv2.Canny(screen_gray, 100, 200))
+            return True
+
+        sh, sw = screen_gray.shape
+        th, tw = self.template.gray.shape
+        rh, rw = sh - th + 1, sw - tw + 1
+        edges = self.edges.copy()
+        boxes = []
+        for x1, y1, x2, y2 in tile_boxes(changed, self.DIFF_TILE, screen_gray.shape):
+            # Canny output depends on a few pixels around each change, refresh a padded window
+            x1, y1, x2, y2 = max(0, x1 - 2), max(0, y1 - 2), min(sw, x2 + 2), min(sh, y2 + 2)
+            px1, py1, px2, py2 = max(0, x1 - 8), max(0, y1 - 8), min(sw, x2 + 8), min(sh, y2 + 8)
+            window_edges = cv2.Canny(screen_gray[py1:py2, px1:px2], 100, 200)
+            edges[y1:y2, x1:x2] = window_edges[y1 - py1:y2 - py1, x1 - px1:x2 - px1]
+            boxes.append((x1, y1, x2, y2))
+        self.gray = screen_gray
+        self.edges = edges
+
+        tile = self.TILE
+        for x1, y1, x2, y2 in boxes:
+            # Response positions whose template window overlaps the changed box, aligned to tiles
+            tx1, ty1 = max(0, x1 - tw + 1) // tile, max(0, y1 - th + 1) // tile
+            tx2, ty2 = -(-min(rw, x2) // tile), -(-min(rh, y2) // tile)
+            if tx2 <= tx1 or ty2 <= ty1:
+                continue
+            rx1, ry1 = tx1 * tile, ty1 * tile
+            rx2, ry2 = min(rw, tx2 * tile), min(rh, ty2 * tile)
+            gray_window = screen_gray[ry1:ry2 + th - 1, rx1:rx2 + tw - 1]
+            edge_window = edges[ry1:ry2 + th - 1, rx1:rx2 + tw - 1]
+            for method_name, method in _METHODS:
+                if method_name not in self.grids:
+                    continue
+                try:
+                    result = cv2.matchTemplate(gray_window, self.template.gray, method, mask=self.template.mask)
+                    edge_result = cv2.matchTemplate(edge_window, self.template.edges, method, mask=self.template.mask)
+                except Exception as e:
+                    _debug_print(f"Error with {method_name}: {e}")
+                    continue
+                for grid, response in zip(self.grids[method_name], (result, edge_result)):
+                    patch = _tile_extrema(response, tile)
+                    for i, values in enumerate(patch):
+                        # Locations (odd indices after each value grid) are offset to full-frame coordinates
+                        if i in (1, 4):
+                            values = values + rx1
+                        elif i in (2, 5):
+                            values = values + ry1
+                        grid[i][ty1:ty2, tx1:tx2] = values
+        return True
+
+    def extrema(self):
+        """Global minMaxLoc-style extrema of every response map, like _match_extrema."""
+        extrema = {}
+        for method_name, grids in self.grids.items():
+            pair = []
+            for min_vals, min_xs, min_ys, max_vals, max_xs, max_ys in grids:
+                imin = np.unravel_index(np.argmin(min_vals), min_vals.shape)
+                imax = np.unravel_index(np.argmax(max_vals), max_vals.shape)
+                pair.append((float(min_vals[imin]), float(max_vals[imax]),
+                             (int(min_xs[imin]), int(min_ys[imin])),
+                             (int(max_xs[imax]), int(max_ys[imax]))))
+            extrema[method_name] = tuple(pair)
+        return extrema
+
+def get_img_center_coords(template_bgr: np.ndarray,
+                        mask:         np.ndarray,
+                        screen_img:   np.ndarray = None,
+                        x_offset:     int = 0,
+                        y_offset:     int = 0,
+                        timeout:      float = None,
+                        pyramid:      bool = None):
+    """
+    Handles both masked and unmasked template matching with enhanced validation and fallback for low-edge templates.
+    Returns coordinates if found, None if not found.
+    
+    Args:
+        template_bgr: The template image to search for, or a preprocessed Template (mask is then taken from it)
+        mask: Optional mask for the template
+        screen_img: Optional screenshot to search in (will take new screenshot if None)
+        x_offset: X offset to add to found coordinates
+        y_offset: Y offset to add to found coordinates
+        timeout: Optional timeout in seconds. If provided, will keep trying until timeout is reached.
+        pyramid: Use coarse-to-fine pyramid search (None = module default, see set_pyramid_search)
+    """
+    seq = None
+    if screen_img is None:
+        screen_img, region, seq = next_frame()
+    else:
+        region = None
+    template = _as_template(template_bgr, mask)
+    if template is None:
+        _debug_print(f"Failed to load template {template_bgr}")
+        return None
+    screen_gray  = cv2.cvtColor(screen_img,  cv2.COLOR_BGR2GRAY)
+
+    if not _template_usable(template, screen_gray.shape):
+        return None
+
+    # Apply edge detection to the screen (template edges are precomputed)
+    screen_edges = cv2.Canny(screen_gray, 100, 200)
+
+    _debug_print(f"Template edge pixel count: {template.edge_count}, ratio: {template.edge_ratio:.3f}")
+    h, w = template.gray.shape
+    _debug_print(f"Image is {'text-like' if w > h * 3 else 'icon-like'}")
+
+    use_pyramid = _pyramid_search if pyramid is None else pyramid
+
+    def try_match():
+        match = _locate_template(template, screen_gray, screen_edges, use_pyramid)
+        if match is None:
+            return None
+        return _match_center(template, match, region, x_offset, y_offset)
 
     # If no timeout, just try once
     if timeout is None:
@@ -236,9 +509,16 @@ def get_img_center_coords(template_bgr: np.ndarray,
     stable_count = 0
     required_stable_matches = 2  # Number of consecutive matches needed to consider it stable
     check_interval = 0.05  # Check every 50ms instead of 100ms
+
+    # Only rematch what changed between frames (pyramid search just skips unchanged frames)
+    matcher = None if use_pyramid else _IncrementalMatcher(template, screen_gray, screen_edges)
+    if matcher is not None:
+        match = _select_match(template, matcher.extrema())
+    else:
+        match = _locate_template(template, screen_gray, screen_edges, use_pyramid)
     
     while True:
-        result = try_match()
+        result = None if match is None else _match_center(template, match, region, x_offset, y_offset)
         if result is not None:
             if last_match is None:
                 last_match = result
@@ -262,45 +542,290 @@ def get_img_center_coords(template_bgr: np.ndarray,
             _debug_print(f"Timeout reached ({timeout}s) while searching for template")
             return None
             
-        # Take a new screenshot for the next attempt
-        screen_img, region = screenshot()
-        screen_gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
-        screen_edges = cv2.Canny(screen_gray, 100, 200)
+        # Take a new screenshot for the next attempt (blocks for a newer frame when the frame stream is running)
+        screen_img, region, seq = next_frame(seq)
+        new_gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+        if matcher is not None:
+            if matcher.update(new_gray):
+                match = _select_match(template, matcher.extrema())
+            else:
+                _debug_print("Screen unchanged, skipping match", level=3)
+        elif new_gray.shape != screen_gray.shape or changed_tiles(screen_gray, new_gray).any():
+            screen_gray = new_gray
+            screen_edges = cv2.Canny(screen_gray, 100, 200)
+            match = _locate_template(template, screen_gray, screen_edges, use_pyramid)
+        else:
+            _debug_print("Screen unchanged, skipping match", level=3)
         
         # Wait a bit before trying again
-        time.sleep(check_interval)
+        if seq is None:
+            time.sleep(check_interval)
 
-def wait_for_text(target_text: str, timeout: float = 5.0, check_interval: float = 0.1):
+_match_pool = None
+_match_pool_lock = threading.Lock()
+
+def _get_match_pool():
+    """Shared thread pool for per-template matching (OpenCV releases the GIL)."""
+    global _match_pool
+    if _match_pool is None:
+        with _match_pool_lock:
+            if _match_pool is None:
+                _match_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                                 thread_name_prefix="PyAutomateMatch")
+    return _match_pool
+
+def find_all_templates(templates, screen_img=None, x_offset=0, y_offset=0, pyramid=None, parallel=True):
     """
-    Wait for text to appear on screen with timeout.
-    Returns True if text was found, False if timeout occurred.
+    Match several templates against one frame.
+
+    The screen is converted to gray and run through Canny once, then every template
+    is matched against those shared products (on a thread pool when parallel=True).
+
+    Args:
+        templates: List of Templates, BGR arrays or 'img/...' paths
+        screen_img: Optional screenshot to search in (will take new screenshot if None)
+        x_offset: X offset to add to found coordinates
+        y_offset: Y offset to add to found coordinates
+        pyramid: Use coarse-to-fine pyramid search (None = module default)
+        parallel: Match templates concurrently on the shared thread pool
+
+    Returns:
+        List with the coordinates (or None) for each template, in input order.
     """
+    region = None
+    if screen_img is None:
+        screen_img, region, _ = next_frame()
+    screen_gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+    screen_edges = cv2.Canny(screen_gray, 100, 200)
+    use_pyramid = _pyramid_search if pyramid is None else pyramid
+
+    def match_one(template):
+        if template is None or not _template_usable(template, screen_gray.shape):
+            return None
+        match = _locate_template(template, screen_gray, screen_edges, use_pyramid)
+        if match is None:
+            return None
+        return _match_center(template, match, region, x_offset, y_offset)
+
+    resolved = [_as_template(t) for t in templates]
+    for t, template in zip(templates, resolved):
+        if template is None:
+            _debug_print(f"Failed to load template {t}")
+    if parallel and len(resolved) > 1:
+        return list(_get_match_pool().map(match_one, resolved))
+    return [match_one(template) for template in resolved]
+
+def _response_peaks(response, threshold, template_shape, max_candidates=2000):
+    """
+    Extract every local maximum above `threshold` from a similarity map.
+
+    Peaks are found with one dilation (a pixel is kept if it is the maximum of its
+    half-template neighbourhood), then plateaus and near-duplicates are removed with
+    greedy non-maximum suppression in score order: a peak is kept only if no peak
+    already kept lies within half a template of it. Only the best `max_candidates`
+    peaks are considered; a warning is printed when more were found.
+
+    Returns:
+        (xs, ys, scores) arrays sorted by descending score
+    """
+    h, w = template_shape
+    kernel = np.ones(((h // 2) * 2 + 1, (w // 2) * 2 + 1), np.uint8)
+    dilated = cv2.dilate(response, kernel)
+    ys, xs = np.nonzero((response >= threshold) & (response >= dilated))
+    scores = response[ys, xs]
+    if len(scores) > max_candidates:
+        print(f"[MATCH-WARN] {len(scores)} peaks above {threshold}, only the best {max_candidates} are considered; "
+              f"raise the threshold")
+    order = np.argsort(-scores, kind='stable')[:max_candidates]
+    xs, ys, scores = xs[order], ys[order], scores[order]
+    rx, ry = max(1, w // 2), max(1, h // 2)
+    kept = []
+    for i in range(len(scores)):
+        if not kept or not ((np.abs(xs[kept] - xs[i]) < rx) & (np.abs(ys[kept] - ys[i]) < ry)).any():
+            kept.append(i)
+    return xs[kept], ys[kept], scores[kept]
+
+def find_all(template, screen_img=None, threshold=0.8, method=cv2.TM_CCOEFF_NORMED,
+             max_results=None, x_offset=0, y_offset=0):
+    """
+    Find every occurrence of a template in one pass.
+
+    Args:
+        template: Template, BGR array or 'img/...' path
+        screen_img: Optional screenshot to search in (will take new screenshot if None)
+        threshold: Minimum similarity (0-1) for a match
+        method: cv2 matching method (TM_SQDIFF_NORMED scores are converted to similarity)
+        max_results: Optional limit on the number of matches returned
+        x_offset: X offset to add to found coordinates
+        y_offset: Y offset to add to found coordinates
+
+    Returns:
+        List of (cx, cy, score) tuples sorted by descending score.
+    """
+    region = None
+    if screen_img is None:
+        screen_img, region, _ = next_frame()
+    template = _as_template(template)
+    if template is None:
+        _debug_print("Failed to load template")
+        return []
+    screen_gray = cv2.cvtColor(screen_img, cv2.COLOR_BGR2GRAY)
+    if not _template_usable(template, screen_gray.shape):
+        return []
+
+    response = cv2.matchTemplate(screen_gray, template.gray, method, mask=template.mask)
+    if method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
+        response = 1 - response
+    response = np.nan_to_num(response, nan=-1.0, posinf=-1.0, neginf=-1.0)
+
+    xs, ys, scores = _response_peaks(response, threshold, template.gray.shape)
+    if max_results is not None:
+        xs, ys, scores = xs[:max_results], ys[:max_results], scores[:max_results]
+
+    h, w = template.gray.shape
+    left = region['left'] if region is not None else 0
+    top = region['top'] if region is not None else 0
+    cxs = xs + w//2 + x_offset + left
+    cys = ys + h//2 + y_offset + top
+    matches = [(int(cx), int(cy), float(score)) for cx, cy, score in zip(cxs, cys, scores)]
+    _debug_print(f"Found {len(matches)} match(es) above {threshold}")
+    return matches
+
+def find_any(templates, screen_img=None, x_offset=0, y_offset=0, timeout=None, pyramid=None, parallel=True):
+    """
+    Find which of several templates is on screen.
+
+    Args:
+        templates: List of Templates, BGR arrays or 'img/...' paths, in priority order
+        screen_img: Optional screenshot to search in (will take new screenshot if None)
+        x_offset: X offset to add to found coordinates
+        y_offset: Y offset to add to found coordinates
+        timeout: Optional timeout in seconds. If provided, will keep trying until timeout is reached.
+        pyramid: Use coarse-to-fine pyramid search (None = module default)
+        parallel: Match templates concurrently on the shared thread pool
+
+    Returns:
+        (index, coordinates) of the first template in the list that was found, or None.
+    """
+    templates = [_as_template(t) for t in templates]
     start_time = time.time()
-    while time.time() - start_time < timeout:
-        # Take screenshot and do OCR
-        screen_img, region = screenshot()
-        ocr_result = ocr.ocr(screen_img)
-        
-        # Check if text exists
-        full_text = ''.join([t for t in ocr_result['text'] if t.strip()])
-        if target_text in full_text:
-            return True
-            
-        time.sleep(check_interval)
-    
-    return False
+    seq = None
+    region = None
+    while True:
+        if screen_img is None:
+            screen_img, region, seq = next_frame(seq)
+        results = find_all_templates(templates, screen_img, x_offset, y_offset, pyramid, parallel)
+        for index, coords in enumerate(results):
+            if coords is not None:
+                if region is not None:
+                    coords = (coords[0] + region['left'], coords[1] + region['top'])
+                return index, coords
+        if timeout is None or time.time() - start_time > timeout:
+            return None
+        screen_img = None
+        if seq is None:
+            time.sleep(0.05)
 
-def wait_for_screen_change(timeout: float = 5.0, check_interval: float = 0.1):
+def wait_for_text(target_text: str, timeout: float = 5.0, check_interval: float = 0.1, region=None,
+                  scale_factor: int = 2, tile: int = 16, tolerance: int = 0, tiled: bool = True,
+                  profile=None, rescan_interval: float = 1.0):
     """
-    Wait for screen to change with timeout.
-    Returns True if screen changed, False if timeout occurred.
+    Wait for text to appear on screen (or in a region of it) with timeout.
+
+    The text counts as found when it is a substring of all recognized text joined
+    together, as before. OCR only runs again when a pixel of the watched area changed
+    since the last OCR pass (see changed_tiles), and at least every `rescan_interval`
+    seconds regardless.
+
+    Args:
+        target_text: Text to wait for
+        timeout: Maximum time to wait in seconds
+        check_interval: Delay between checks when no frame stream is running
+        region: Optional (x1, y1, x2, y2) screen region to watch
+        scale_factor: Upscale factor applied before OCR
+        tile: Tile size in pixels for change detection
+        tolerance: Largest per-pixel difference still treated as unchanged (0 = exact)
+        tiled: Use the tile-level OCR cache (see ocr_tiles)
+        profile: OCR profile name or OCRProfile (default: the session profile)
+        rescan_interval: Maximum seconds between OCR passes on an unchanged area
+
+    Returns:
+        (x, y) screen coordinates of the text when a single text block contains it,
+        True when it was only found across blocks, or False if timeout occurred.
+    """
+    watch = None
+    if region is not None:
+        x1, y1, x2, y2 = region
+        watch = {"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1}
+    start_time = time.time()
+    seq = None
+    reference = None
+    last_ocr = 0.0
+    while True:
+        screen_img, frame_region, seq = next_frame(seq, region=watch, copy=True)
+        if (reference is None or screen_img.shape != reference.shape
+                or time.time() - last_ocr >= rescan_interval
+                or changed_tiles(reference, screen_img, tile, tolerance).any()):
+            reference = screen_img
+            last_ocr = time.time()
+            scaled_img = cv2.resize(screen_img, None, fx=scale_factor, fy=scale_factor)
+            ocr_result = (_ocr_module.ocr_tiles(scaled_img, frame_region, profile=profile) if tiled
+                          else ocr(scaled_img, frame_region, profile=profile))
+            full_text = ''.join([t for t in ocr_result['text'] if t.strip()])
+            if target_text in full_text:
+                coords = get_text_center_coords(ocr_result, target_text, scale_factor, region=frame_region)
+                return coords if coords else True
+        else:
+            _debug_print("Watched area unchanged, skipping OCR")
+        if time.time() - start_time >= timeout:
+            return False
+        if seq is None:
+            time.sleep(check_interval)
+
+def wait_for_screen_change(timeout: float = 5.0, check_interval: float = 0.1, region=None,
+                           min_changed_area: int = 0, tile: int = 16, tolerance: int = 0):
+    """
+    Wait for the screen (or a region of it) to change with timeout.
+
+    Frames are compared tile by tile on the largest per-pixel difference of each tile
+    (see changed_tiles), so by default any changed pixel counts, as with a full array
+    comparison. Changes smaller than `min_changed_area` pixels, such as a blinking
+    cursor or a clock, can be ignored. Each poll costs about as much as comparing the
+    full frames (one absdiff and a max per tile); watch a region to make it cheaper.
+
+    Args:
+        timeout: Maximum time to wait in seconds
+        check_interval: Delay between checks when no frame stream is running
+        region: Optional (x1, y1, x2, y2) screen region to watch
+        min_changed_area: Minimum changed area in pixels (changed tiles x tile area)
+        tile: Tile size in pixels
+        tolerance: Largest per-pixel difference still treated as unchanged (0 = exact)
+
+    Returns:
+        (x1, y1, x2, y2) screen bounding box of the change, or False if timeout occurred.
+        Callers that only test the result for truth work as before (it used to be True).
     """
+    watch = None
+    if region is not None:
+        x1, y1, x2, y2 = region
+        watch = {"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1}
     start_time = time.time()
-    current_screen, _ = screenshot()
+    reference, frame_region, seq = next_frame(region=watch, copy=True)
     while time.time() - start_time < timeout:
-        new_screen, _ = screenshot()
-        # Check if arrays are different using numpy's array comparison
-        if not np.array_equal(new_screen, current_screen):
-            return True
-        time.sleep(check_interval)
-    return False
\ No newline at end of file
+        new_screen, frame_region, seq = next_frame(seq, region=watch, copy=True)
+        h, w = new_screen.shape[:2]
+        left = frame_region['left'] if frame_region is not None else 0
+        top = frame_region['top'] if frame_region is not None else 0
+        if new_screen.shape != reference.shape:
+            _debug_print("Screen size changed")
+            return (left, top, left + w, top + h)
+        changed = changed_tiles(reference, new_screen, tile, tolerance)
+        if changed.any() and int(changed.sum()) * tile * tile >= max(1, min_changed_area):
+            ys, xs = np.nonzero(changed)
+            bbox = (left + int(xs.min()) * tile, top + int(ys.min()) * tile,
+                    left + min(w, (int(xs.max()) + 1) * tile), top + min(h, (int(ys.max()) + 1) * tile))
+            _debug_print(f"Screen changed in {bbox}")
+            return bbox
+        if seq is None:
+            time.sleep(check_interval)
+    return False